@@ -315,7 +315,7 @@ class AdminTimelineEventUpdateView(generics.UpdateAPIView):
     """
     serializer_class = AdminTimelineEventSerializer
     permission_classes = [IsAdminUser]
-    queryset = PatientTimeline.objects.all()
+    queryset = PatientTimeline.objects.with_created_by_name()
     lookup_field = 'id'
     
     @swagger_auto_schema(
@@ -404,7 +404,7 @@ class AdminTimelineEventListView(generics.ListAPIView):
         if patient_id:
             return PatientTimeline.objects.filter(
                 patient_profile_id=patient_id
-            ).select_related('patient_profile', 'created_by').order_by('created_at')
+            ).with_created_by_name().order_by('created_at')
         return PatientTimeline.objects.none()
 
 
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from datetime import date
+from django.utils.functional import cached_property
 from .models import CustomUser
 from .lookups import CountryLookup
 from patient.models import PatientProfile, ExpenseTypeLookup, TreatmentCostBreakdown, PatientTimeline
@@ -185,7 +186,7 @@ class TreatmentCostBreakdownSerializer(serializers.ModelSerializer):
 class PatientTimelineSerializer(serializers.ModelSerializer):
     formatted_date = serializers.ReadOnlyField()
     event_type_display = serializers.CharField(source='get_event_type_display', read_only=True)
-    is_future = serializers.ReadOnlyField()
+    is_future = serializers.SerializerMethodField()
     created_by_name = serializers.SerializerMethodField()
     
     class Meta:
@@ -197,7 +198,17 @@ class PatientTimelineSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'formatted_date', 'is_future']
     
+    @cached_property
+    def _today(self):
+        # Read the clock once per serializer; a many=True child is shared by every event
+        return date.today()
+    
+    def get_is_future(self, obj):
+        return bool(obj.event_date) and obj.event_date > self._today
+    
     def get_created_by_name(self, obj):
+        if hasattr(obj, 'created_by_name'):  # PatientTimeline.objects.with_created_by_name()
+            return obj.created_by_name
         if obj.created_by:
             return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.email
         return None
@@ -339,6 +350,8 @@ class AdminTimelineEventSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'formatted_date', 'created_at', 'updated_at']
     
     def get_created_by_name(self, obj):
+        if hasattr(obj, 'created_by_name'):  # PatientTimeline.objects.with_created_by_name()
+            return obj.created_by_name
         if obj.created_by:
             return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.email
         return None
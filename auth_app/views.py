@@ -209,10 +209,10 @@ class PublicPatientProfileView(generics.RetrieveAPIView):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
-        # Only show published or fully funded patients
+        # Only show published or fully funded patients; prefetches also back cost_breakdown_total
         return PatientProfile.objects.filter(
             status__in=['PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED', 'TREATMENT_COMPLETE']
-        )
+        ).with_age_data().with_funding_received().with_cost_breakdowns().with_timeline()
 
 
 class PatientProfileListView(generics.ListAPIView):
@@ -236,9 +236,10 @@ class PatientProfileListView(generics.ListAPIView):
     
     def get_queryset(self):
         # Only show published, awaiting funding, or fully funded patients
+        # Prefetched breakdowns serve both the nested list and cost_breakdown_total per page
         return PatientProfile.objects.filter(
             status__in=['PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED']
-        ).select_related('user')
+        ).with_age_data().with_funding_received().with_cost_breakdowns().with_timeline()
 
 
 class CountryLookupListView(generics.ListAPIView):
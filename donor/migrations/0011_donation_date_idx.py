@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-16 10:30
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donor', '0010_increase_payment_method_to_255'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(django.db.models.functions.datetime.TruncDate('created_at'), name='donation_date_idx'),
+        ),
+    ]
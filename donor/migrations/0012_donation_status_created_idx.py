@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donor', '0011_donation_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['status', '-created_at'], name='donor_donat_status_818898_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donor', '0012_donation_status_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donorprofile',
+            index=models.Index(fields=['created_at'], name='donor_created_idx'),
+        ),
+    ]
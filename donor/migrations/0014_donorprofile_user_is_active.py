@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-16 13:00
+
+from django.db import migrations, models
+
+
+def backfill_user_is_active(apps, schema_editor):
+    DonorProfile = apps.get_model('donor', 'DonorProfile')
+    DonorProfile.objects.filter(user__is_active=True).update(user_is_active=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donor', '0013_donorprofile_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='donorprofile',
+            name='user_is_active',
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_user_is_active, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-16 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donor', '0014_donorprofile_user_is_active'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='donation',
+            constraint=models.CheckConstraint(condition=models.Q(('amount__gt', 0)), name='donation_amount_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='donation',
+            constraint=models.CheckConstraint(condition=models.Q(('patient_amount__gte', 0), ('rhci_support_amount__gte', 0)), name='donation_split_gte_0'),
+        ),
+    ]
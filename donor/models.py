@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import TruncDate
 from django.conf import settings
 from datetime import date
 from decimal import Decimal
@@ -23,16 +24,27 @@ class DonorProfile(models.Model):
     # Privacy
     is_profile_private = models.BooleanField(default=False, help_text="Make profile visible only to you")
     
+    # Denormalized copy of user.is_active (kept in sync by donor.signals) for join-free counts
+    user_is_active = models.BooleanField(default=False, db_index=True, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         db_table = 'auth_app_donorprofile'  # Keep existing table name
+        indexes = [
+            models.Index(fields=['created_at'], name='donor_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.full_name or self.user.email} - Donor Profile"
     
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.user_is_active = self.user.is_active
+        super().save(*args, **kwargs)
+    
     @property
     def age(self):
         """Calculate age from birthday"""
@@ -248,10 +260,19 @@ class Donation(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['status']),
+            models.Index(fields=['status', '-created_at']),  # For latest completed donations
             models.Index(fields=['donor', '-created_at']),
             models.Index(fields=['patient', '-created_at']),
             models.Index(fields=['transaction_id']),
             models.Index(fields=['rhci_support_amount', 'status']),  # For filtering RHCI donations
+            models.Index(TruncDate('created_at'), name='donation_date_idx'),  # For per-day roll-ups
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(amount__gt=0), name='donation_amount_positive'),
+            models.CheckConstraint(
+                condition=models.Q(patient_amount__gte=0, rhci_support_amount__gte=0),
+                name='donation_split_gte_0',
+            ),
         ]
     
     def clean(self):
@@ -301,10 +322,14 @@ class Donation(models.Model):
         if not self.is_recurring or not self.is_recurring_active:
             return self.amount
         
-        total = Donation.objects.filter(
-            parent_donation=self,
-            status='COMPLETED'
-        ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
+        # List querysets annotate this (see DonationSerializer.setup_eager_loading)
+        if hasattr(self, 'recurring_completed_total'):
+            total = self.recurring_completed_total or Decimal('0.00')
+        else:
+            total = Donation.objects.filter(
+                parent_donation=self,
+                status='COMPLETED'
+            ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
         
         return total + self.amount
 
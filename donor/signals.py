@@ -11,3 +11,14 @@ def create_donor_profile(sender, instance, created, **kwargs):
     if created and instance.user_type == 'DONOR':
         from .models import DonorProfile
         DonorProfile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=User)
+def sync_donor_profile_active_flag(sender, instance, created, **kwargs):
+    """Keep DonorProfile.user_is_active in step with the user's is_active flag"""
+    if created:
+        return
+    from .models import DonorProfile
+    DonorProfile.objects.filter(user=instance).exclude(
+        user_is_active=instance.is_active
+    ).update(user_is_active=instance.is_active)
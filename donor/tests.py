@@ -1,3 +1,31 @@
 from django.test import TestCase
 
-# Create your tests here.
+from auth_app.models import CustomUser
+from .models import DonorProfile
+
+
+class DonorProfileActiveFlagTests(TestCase):
+    """DonorProfile.user_is_active mirrors CustomUser.is_active"""
+
+    def test_flag_is_copied_on_profile_creation(self):
+        user = CustomUser.objects.create_user(
+            email='donor@example.com', password='pass12345', user_type='DONOR', is_active=True
+        )
+        self.assertTrue(DonorProfile.objects.get(user=user).user_is_active)
+
+    def test_flag_follows_user_is_active_on_save(self):
+        user = CustomUser.objects.create_user(
+            email='donor@example.com', password='pass12345', user_type='DONOR'
+        )
+        profile = DonorProfile.objects.get(user=user)
+        self.assertFalse(profile.user_is_active)
+
+        user.is_active = True
+        user.save()
+        profile.refresh_from_db()
+        self.assertTrue(profile.user_is_active)
+
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+        profile.refresh_from_db()
+        self.assertFalse(profile.user_is_active)
@@ -603,12 +603,8 @@ class DonationCreateView(generics.CreateAPIView):
         if request.user.is_authenticated and not donation_data.get('is_anonymous'):
             donation_data['donor'] = request.user
         
-        # Get patient if specified
-        patient = None
-        if donation_data.get('patient_id'):
-            from patient.models import PatientProfile
-            patient = PatientProfile.objects.get(id=donation_data.pop('patient_id'))
-            donation_data['patient'] = patient
+        # The serializer has already resolved patient_id into donation_data['patient']
+        donation_data.pop('patient_id', None)
         
         # Capture IP and user agent
         donation_data['ip_address'] = self.get_client_ip(request)
@@ -660,7 +656,7 @@ class MyDonationsView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
-        return Donation.objects.filter(donor=self.request.user).select_related('patient')
+        return DonationSerializer.setup_eager_loading(Donation.objects.filter(donor=self.request.user))
 
 
 class DonationDetailView(generics.RetrieveAPIView):
@@ -694,8 +690,8 @@ class DonationDetailView(generics.RetrieveAPIView):
     
     def get_queryset(self):
         if self.request.user.is_staff:
-            return Donation.objects.all().select_related('patient', 'donor')
-        return Donation.objects.filter(donor=self.request.user).select_related('patient')
+            return DonationSerializer.setup_eager_loading(Donation.objects.all())
+        return DonationSerializer.setup_eager_loading(Donation.objects.filter(donor=self.request.user))
 
 
 # ============ ADMIN DONATION VIEWS ============
@@ -706,7 +702,7 @@ class AdminDonationListView(generics.ListAPIView):
     """
     serializer_class = DonationDetailSerializer
     permission_classes = [IsAdminUser]
-    queryset = Donation.objects.all().select_related('patient', 'donor').order_by('-created_at')
+    queryset = DonationDetailSerializer.setup_eager_loading(Donation.objects.order_by('-created_at'))
     
     @swagger_auto_schema(
         tags=['Admin - Donations'],
@@ -760,7 +756,7 @@ class AdminDonationDetailView(generics.RetrieveUpdateAPIView):
     """
     serializer_class = DonationDetailSerializer
     permission_classes = [IsAdminUser]
-    queryset = Donation.objects.all().select_related('patient', 'donor')
+    queryset = DonationDetailSerializer.setup_eager_loading(Donation.objects.all())
     lookup_field = 'id'
     
     @swagger_auto_schema(
@@ -858,10 +854,10 @@ class PatientDonationsView(generics.ListAPIView):
     
     def get_queryset(self):
         patient_id = self.kwargs['patient_id']
-        return Donation.objects.filter(
+        return DonationSerializer.setup_eager_loading(Donation.objects.filter(
             patient_id=patient_id,
             status='COMPLETED'
-        ).select_related('donor').order_by('-completed_at')
+        )).order_by('-completed_at')
 
 
 # ============ ADMIN DONOR MANAGEMENT ============
@@ -8,6 +8,10 @@ class TreatmentCostBreakdownInline(admin.TabularInline):
     extra = 1
     fields = ['expense_type', 'amount', 'notes']
     autocomplete_fields = ['expense_type']
+    
+    def get_queryset(self, request):
+        # Row labels render __str__, which reads both related names
+        return super().get_queryset(request).select_related('patient_profile', 'expense_type')
 
 
 class DonationAmountOptionInline(admin.TabularInline):
@@ -15,6 +19,9 @@ class DonationAmountOptionInline(admin.TabularInline):
     model = DonationAmountOption
     extra = 1
     fields = ['amount', 'display_order', 'is_active', 'is_recommended']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('patient_profile')
 
 
 class PatientTimelineInline(admin.TabularInline):
@@ -24,6 +31,9 @@ class PatientTimelineInline(admin.TabularInline):
     fields = ['event_type', 'title', 'description', 'event_date', 'created_by', 'is_milestone', 'is_visible', 'is_current_state', 'created_at']
     readonly_fields = ['created_at']
     ordering = ['created_at']  # Chronological order (oldest first)
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('patient_profile')
 
 
 @admin.register(PatientProfile)
@@ -64,6 +74,10 @@ class PatientProfileAdmin(admin.ModelAdmin):
             'fields': ('status', 'is_featured', 'rejection_reason', 'created_at', 'updated_at')
         }),
     )
+    
+    def get_queryset(self, request):
+        # cost_breakdown_total is a list column; sum it in the list query instead of per row
+        return super().get_queryset(request).with_funding_totals()
 
 
 @admin.register(ExpenseTypeLookup)
@@ -81,6 +95,10 @@ class TreatmentCostBreakdownAdmin(admin.ModelAdmin):
     list_filter = ['expense_type', 'created_at']
     search_fields = ['patient_profile__full_name', 'expense_type__name']
     autocomplete_fields = ['patient_profile', 'expense_type']
+    
+    def get_queryset(self, request):
+        # Also used by bulk actions (e.g. delete confirmation), which render __str__ per row
+        return super().get_queryset(request).select_related('patient_profile', 'expense_type')
 
 
 @admin.register(PatientTimeline)
@@ -101,3 +119,7 @@ class PatientTimelineAdmin(admin.ModelAdmin):
             'fields': ('formatted_date', 'created_at', 'updated_at', 'is_future')
         }),
     )
+    
+    def get_queryset(self, request):
+        # Also used by bulk actions (e.g. delete confirmation), which render __str__ per row
+        return super().get_queryset(request).select_related('patient_profile')
@@ -2,6 +2,8 @@ from rest_framework import generics, status, filters
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
 from django.db.models import Q
 from django.utils import timezone
 from drf_yasg.utils import swagger_auto_schema
@@ -26,6 +28,12 @@ from .serializers import (
 )
 
 
+# Statuses in which a patient may be featured on the homepage
+FEATURABLE_STATUSES = frozenset({'PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED'})
+# Statuses in which a patient profile is publicly visible
+PUBLIC_PATIENT_STATUSES = FEATURABLE_STATUSES | {'TREATMENT_COMPLETE'}
+
+
 # ============ ADMIN PATIENT REVIEW VIEWS ============
 
 class AdminPatientListView(generics.ListAPIView):
@@ -61,9 +69,7 @@ class AdminPatientListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
-        queryset = PatientProfile.objects.all().select_related('user').prefetch_related(
-            'cost_breakdowns', 'timeline_events'
-        )
+        queryset = AdminPatientReviewSerializer.setup_eager_loading(PatientProfile.objects.all())
         
         # Filter by status
         status_filter = self.request.query_params.get('status', None)
@@ -136,9 +142,7 @@ class AdminPatientDetailView(generics.RetrieveUpdateAPIView):
         return super().put(request, *args, **kwargs)
     
     def get_queryset(self):
-        return PatientProfile.objects.all().select_related('user').prefetch_related(
-            'cost_breakdowns', 'timeline_events'
-        )
+        return AdminPatientReviewSerializer.setup_eager_loading(PatientProfile.objects.all())
 
 
 class AdminPatientApprovalView(APIView):
@@ -439,7 +443,7 @@ class AdminTimelineEventUpdateView(generics.UpdateAPIView):
     """
     serializer_class = AdminTimelineEventSerializer
     permission_classes = [IsAdminUser]
-    queryset = PatientTimeline.objects.all()
+    queryset = PatientTimeline.objects.with_created_by_name()
     lookup_field = 'id'
     
     @swagger_auto_schema(
@@ -545,7 +549,7 @@ class AdminTimelineEventListView(generics.ListAPIView):
         if patient_id:
             return PatientTimeline.objects.filter(
                 patient_profile_id=patient_id
-            ).select_related('patient_profile', 'created_by').order_by('created_at')
+            ).with_created_by_name().order_by('created_at')
         return PatientTimeline.objects.none()
 
 
@@ -573,10 +577,10 @@ class PublicPatientDetailView(generics.RetrieveAPIView):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
-        return PatientProfile.objects.filter(
+        return PatientProfileSerializer.setup_eager_loading(PatientProfile.objects.filter(
             user__is_patient_verified=True,
-            status__in=['PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED', 'TREATMENT_COMPLETE']
-        ).select_related('user', 'country_fk', 'video').prefetch_related('cost_breakdowns', 'timeline_events', 'images')
+            status__in=PUBLIC_PATIENT_STATUSES
+        ))
 
 
 class PublicPatientListView(generics.ListAPIView):
@@ -611,10 +615,10 @@ class PublicPatientListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
-        queryset = PatientProfile.objects.filter(
+        queryset = PatientProfileSerializer.setup_eager_loading(PatientProfile.objects.filter(
             user__is_patient_verified=True,
             status__in=['PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED']
-        ).select_related('user', 'country_fk', 'video').prefetch_related('cost_breakdowns', 'timeline_events', 'images')
+        ))
         
         # Filter by country
         country = self.request.query_params.get('country', None)
@@ -661,13 +665,11 @@ class PublicFeaturedPatientsView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
-        return PatientProfile.objects.filter(
+        return PatientProfileSerializer.setup_eager_loading(PatientProfile.objects.filter(
             user__is_patient_verified=True,
             status__in=['PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED'],
             is_featured=True
-        ).select_related('user', 'country_fk', 'video').prefetch_related(
-            'cost_breakdowns', 'timeline_events', 'images'
-        ).order_by('-created_at')[:6]  # Limit to 6 featured patients
+        )).order_by('-created_at')[:6]  # Limit to 6 featured patients
 
 
 # ============ NEW COMPREHENSIVE ADMIN PATIENT MANAGEMENT VIEWS ============
@@ -725,11 +727,7 @@ class AdminPatientManagementListView(generics.ListCreateAPIView):
         return super().post(request, *args, **kwargs)
     
     def get_queryset(self):
-        queryset = PatientProfile.objects.select_related(
-            'user', 'country_fk'
-        ).prefetch_related(
-            'cost_breakdowns', 'timeline_events'
-        )
+        queryset = AdminPatientManagementSerializer.setup_eager_loading(PatientProfile.objects.all())
         
         # Apply filters
         status = self.request.query_params.get('status')
@@ -841,11 +839,7 @@ class AdminPatientManagementDetailView(generics.RetrieveUpdateDestroyAPIView):
         user.delete()
     
     def get_queryset(self):
-        return PatientProfile.objects.select_related(
-            'user', 'country_fk'
-        ).prefetch_related(
-            'cost_breakdowns', 'timeline_events'
-        )
+        return AdminPatientManagementSerializer.setup_eager_loading(PatientProfile.objects.all())
 
 
 class AdminPatientBulkActionView(APIView):
@@ -891,48 +885,50 @@ class AdminPatientBulkActionView(APIView):
                 'message': 'No patients found with provided IDs'
             }, status=status.HTTP_404_NOT_FOUND)
         
+        # Featuring has no post_save side effects, so flip the whole selection in one UPDATE
+        if action in ('feature', 'unfeature'):
+            affected_ids = list(patients.values_list('id', flat=True))
+            patients.update(is_featured=(action == 'feature'), updated_at=timezone.now())
+            return Response({
+                'success': True,
+                'message': f'Bulk {action} completed',
+                'affected_count': len(affected_ids),
+                'results': [{'patient_id': patient_id, 'status': f'{action}d'} for patient_id in affected_ids]
+            })
+        
         results = []
         affected_count = 0
         
+        if action == 'delete':
+            patients = patients.select_related('user')
+        
         for patient in patients:
             try:
                 if action == 'approve':
                     patient.status = 'SCHEDULED'
-                    patient.save()
+                    patient.save(update_fields=['status', 'updated_at'])
                     results.append({'patient_id': patient.id, 'status': 'approved'})
                     affected_count += 1
                     
                 elif action == 'reject':
                     patient.status = 'SUBMITTED'
                     patient.rejection_reason = reason
-                    patient.save()
+                    patient.save(update_fields=['status', 'rejection_reason', 'updated_at'])
                     results.append({'patient_id': patient.id, 'status': 'rejected'})
                     affected_count += 1
                     
                 elif action == 'publish':
                     patient.status = 'PUBLISHED'
-                    patient.save()
+                    patient.save(update_fields=['status', 'updated_at'])
                     results.append({'patient_id': patient.id, 'status': 'published'})
                     affected_count += 1
                     
                 elif action == 'unpublish':
                     patient.status = 'SCHEDULED'
-                    patient.save()
+                    patient.save(update_fields=['status', 'updated_at'])
                     results.append({'patient_id': patient.id, 'status': 'unpublished'})
                     affected_count += 1
                     
-                elif action == 'feature':
-                    patient.is_featured = True
-                    patient.save()
-                    results.append({'patient_id': patient.id, 'status': 'featured'})
-                    affected_count += 1
-                    
-                elif action == 'unfeature':
-                    patient.is_featured = False
-                    patient.save()
-                    results.append({'patient_id': patient.id, 'status': 'unfeatured'})
-                    affected_count += 1
-                    
                 elif action == 'delete':
                     user = patient.user
                     patient.delete()
@@ -994,7 +990,7 @@ class AdminPatientFeaturedToggleView(APIView):
         from .serializers import AdminPatientFeaturedSerializer
         
         # Get patient
-        patient = get_object_or_404(PatientProfile, id=id)
+        patient = get_object_or_404(PatientProfile.objects.select_related('user'), id=id)
         
         # Validate input
         serializer = AdminPatientFeaturedSerializer(
@@ -1006,7 +1002,7 @@ class AdminPatientFeaturedToggleView(APIView):
         is_featured = serializer.validated_data['is_featured']
         
         # Check if patient is published (only published patients should be featured)
-        if is_featured and patient.status not in ['PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED']:
+        if is_featured and patient.status not in FEATURABLE_STATUSES:
             return Response(
                 {
                     'error': 'Only published patients can be featured',
@@ -1137,10 +1133,10 @@ class PublicPatientDonorsListView(generics.ListAPIView):
         
         # Verify patient exists and is published
         patient = get_object_or_404(
-            PatientProfile,
+            PatientProfile.objects.select_related('user').only('id', 'status', 'user__is_patient_verified'),
             id=patient_id,
             user__is_patient_verified=True,
-            status__in=['PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED', 'TREATMENT_COMPLETE']
+            status__in=PUBLIC_PATIENT_STATUSES
         )
         
         # Get all completed donations for this patient
@@ -1149,6 +1145,10 @@ class PublicPatientDonorsListView(generics.ListAPIView):
             status='COMPLETED'
         ).select_related('donor', 'donor__donor_profile').order_by('-created_at')
         
+        # Resolve scheme/host once instead of re-parsing the request per donor
+        base_uri = request.build_absolute_uri('/').rstrip('/')
+        storage_url = default_storage.url
+        
         # Build donor list
         donors_data = []
         for donation in donations:
@@ -1175,8 +1175,9 @@ class PublicPatientDonorsListView(generics.ListAPIView):
                     
                     # Add photo if not private
                     if not profile.is_profile_private and profile.photo:
+                        photo_url = storage_url(profile.photo.name)
                         donor_info['donor_photo'] = profile.photo.name
-                        donor_info['donor_photo_url'] = request.build_absolute_uri(profile.photo.url)
+                        donor_info['donor_photo_url'] = photo_url if '://' in photo_url else base_uri + photo_url
                     else:
                         donor_info['donor_photo'] = None
                         donor_info['donor_photo_url'] = None
@@ -1431,20 +1432,28 @@ class AdminBulkCostBreakdownCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        created_items = []
-        total_cost = 0
+        # Validate every item up front so nothing is written on a bad payload
+        serializer = TreatmentCostBreakdownSerializer(data=items, many=True)
+        if not serializer.is_valid():
+            return Response(
+                {'error': 'Validation failed', 'details': serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        for item_data in items:
-            serializer = TreatmentCostBreakdownSerializer(data=item_data)
-            if serializer.is_valid():
-                breakdown = serializer.save(patient_profile=patient)
-                created_items.append(TreatmentCostBreakdownSerializer(breakdown).data)
-                total_cost += breakdown.amount
-            else:
-                return Response(
-                    {'error': 'Validation failed', 'details': serializer.errors},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        breakdowns = [
+            TreatmentCostBreakdown(patient_profile=patient, **item)
+            for item in serializer.validated_data
+        ]
+        if connection.features.can_return_rows_from_bulk_insert:
+            # Single multi-row INSERT instead of one INSERT per item
+            TreatmentCostBreakdown.objects.bulk_create(breakdowns, batch_size=1000)
+        else:
+            # MySQL returns no ids from a multi-row INSERT; save per item so the response carries them
+            with transaction.atomic():
+                for breakdown in breakdowns:
+                    breakdown.save()
+        created_items = TreatmentCostBreakdownSerializer(breakdowns, many=True).data
+        total_cost = sum((breakdown.amount for breakdown in breakdowns), 0)
         
         return Response({
             'message': f'Successfully created {len(created_items)} cost breakdown items',
@@ -1,90 +1,145 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
-from django.db.models import Count, Sum, Avg, Q, F
+from django.core.cache import cache
+from django.db.models import Count, Sum, Avg, Max, Q, F, Value, FloatField
+from django.db.models.functions import Cast, Coalesce, Concat, NullIf, Trim
 from django.utils import timezone
 from datetime import timedelta
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from rest_framework import serializers
+from rest_framework import serializers, status
 
-from patient.models import PatientProfile
+from patient.models import PatientProfile, DailyStats, CountryStats
 from donor.models import DonorProfile, Donation
 from campaign.models import Campaign
 from auth_app.models import CustomUser
 
+# Dashboard metrics change slowly; serve repeated views from cache for a minute
+DASHBOARD_CACHE_TIMEOUT = 60
+
+# Blocks of the dashboard payload that can be requested via ?sections=
+DASHBOARD_SECTIONS = (
+    'overview', 'patients', 'donors', 'campaigns', 'financial',
+    'activity', 'breakdowns', 'top_performers', 'trends',
+)
+
+# Sizes of the Top Performers lists
+TOP_FUNDED_PATIENTS_LIMIT = 5
+TOP_DONORS_LIMIT = 5
+RECENT_DONATIONS_LIMIT = 10
+
+# Date-independent aggregate expressions, built once and reused by every request
+USER_OVERVIEW_AGGREGATES = {
+    'total': Count('id'),
+    'patients': Count('id', filter=Q(user_type='PATIENT')),
+    'donors': Count('id', filter=Q(user_type='DONOR')),
+    'admins': Count('id', filter=Q(user_type='ADMIN')),
+    'active': Count('id', filter=Q(is_active=True)),
+    'verified': Count('id', filter=Q(is_verified=True)),
+}
+
+PATIENT_TOTALS_AGGREGATES = {
+    'submitted': Count('id', filter=Q(status='SUBMITTED')),
+    'published': Count('id', filter=Q(status='PUBLISHED')),
+    'funded': Count('id', filter=Q(status='FULLY_FUNDED')),
+    'featured': Count('id', filter=Q(is_featured=True)),
+    'total_goal': Sum('funding_required'),
+    'total_raised': Sum('funding_received'),
+    'funding_percentage': Coalesce(
+        Cast(Sum('funding_received'), FloatField()) * 100
+        / NullIf(Cast(Sum('funding_required'), FloatField()), 0.0),
+        0.0
+    ),
+}
+
+DONATION_TOTALS_AGGREGATES = {
+    'total_count': Count('id'),
+    'total_amount': Sum('amount'),
+    'avg_amount': Avg('amount'),
+}
+
+
+def _new_since_aggregates(today_start, week_ago, month_ago):
+    """Registration counts for the today / week / month windows"""
+    return {
+        'new_today': Count('id', filter=Q(created_at__gte=today_start)),
+        'new_week': Count('id', filter=Q(created_at__gte=week_ago)),
+        'new_month': Count('id', filter=Q(created_at__gte=month_ago)),
+    }
+
 
 class AdminDashboardStatsSerializer(serializers.Serializer):
-    """Serializer for comprehensive admin dashboard statistics"""
+    """Serializer for comprehensive admin dashboard statistics (fields of unrequested sections are omitted)"""
     
     # Overview Stats
-    total_users = serializers.IntegerField()
-    total_patients = serializers.IntegerField()
-    total_donors = serializers.IntegerField()
-    total_admins = serializers.IntegerField()
-    active_users = serializers.IntegerField()
-    verified_users = serializers.IntegerField()
+    total_users = serializers.IntegerField(required=False)
+    total_patients = serializers.IntegerField(required=False)
+    total_donors = serializers.IntegerField(required=False)
+    total_admins = serializers.IntegerField(required=False)
+    active_users = serializers.IntegerField(required=False)
+    verified_users = serializers.IntegerField(required=False)
     
     # Patient Stats
-    patients_submitted = serializers.IntegerField()
-    patients_published = serializers.IntegerField()
-    patients_fully_funded = serializers.IntegerField()
-    patients_featured = serializers.IntegerField()
-    patients_pending_review = serializers.IntegerField()
+    patients_submitted = serializers.IntegerField(required=False)
+    patients_published = serializers.IntegerField(required=False)
+    patients_fully_funded = serializers.IntegerField(required=False)
+    patients_featured = serializers.IntegerField(required=False)
+    patients_pending_review = serializers.IntegerField(required=False)
     
     # Donor Stats
-    active_donors = serializers.IntegerField()
-    total_donations_count = serializers.IntegerField()
-    unique_donors_count = serializers.IntegerField()
+    active_donors = serializers.IntegerField(required=False)
+    total_donations_count = serializers.IntegerField(required=False)
+    unique_donors_count = serializers.IntegerField(required=False)
     
     # Campaign Stats
-    total_campaigns = serializers.IntegerField()
-    active_campaigns = serializers.IntegerField()
-    completed_campaigns = serializers.IntegerField()
+    total_campaigns = serializers.IntegerField(required=False)
+    active_campaigns = serializers.IntegerField(required=False)
+    completed_campaigns = serializers.IntegerField(required=False)
     
     # Financial Stats
-    total_funding_goal = serializers.DecimalField(max_digits=12, decimal_places=2)
-    total_funding_raised = serializers.DecimalField(max_digits=12, decimal_places=2)
-    total_donations_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
-    average_donation_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
-    overall_funding_percentage = serializers.FloatField()
+    total_funding_goal = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    total_funding_raised = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    total_donations_amount = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    average_donation_amount = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    overall_funding_percentage = serializers.FloatField(required=False)
     
     # Recent Activity (Last 30 days)
-    new_patients_this_month = serializers.IntegerField()
-    new_donors_this_month = serializers.IntegerField()
-    donations_this_month = serializers.IntegerField()
-    donations_amount_this_month = serializers.DecimalField(max_digits=12, decimal_places=2)
+    new_patients_this_month = serializers.IntegerField(required=False)
+    new_donors_this_month = serializers.IntegerField(required=False)
+    donations_this_month = serializers.IntegerField(required=False)
+    donations_amount_this_month = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
     
     # Recent Activity (Last 7 days)
-    new_patients_this_week = serializers.IntegerField()
-    new_donors_this_week = serializers.IntegerField()
-    donations_this_week = serializers.IntegerField()
-    donations_amount_this_week = serializers.DecimalField(max_digits=12, decimal_places=2)
+    new_patients_this_week = serializers.IntegerField(required=False)
+    new_donors_this_week = serializers.IntegerField(required=False)
+    donations_this_week = serializers.IntegerField(required=False)
+    donations_amount_this_week = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
     
     # Today's Activity
-    new_patients_today = serializers.IntegerField()
-    new_donors_today = serializers.IntegerField()
-    donations_today = serializers.IntegerField()
-    donations_amount_today = serializers.DecimalField(max_digits=12, decimal_places=2)
+    new_patients_today = serializers.IntegerField(required=False)
+    new_donors_today = serializers.IntegerField(required=False)
+    donations_today = serializers.IntegerField(required=False)
+    donations_amount_today = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
     
     # Breakdown by Country
-    patients_by_country = serializers.DictField(child=serializers.IntegerField())
-    donors_by_country = serializers.DictField(child=serializers.IntegerField())
+    patients_by_country = serializers.DictField(child=serializers.IntegerField(), required=False)
+    donors_by_country = serializers.DictField(child=serializers.IntegerField(), required=False)
     
     # Breakdown by Status
-    patients_by_status = serializers.DictField(child=serializers.IntegerField())
+    patients_by_status = serializers.DictField(child=serializers.IntegerField(), required=False)
     
     # Breakdown by Gender
-    patients_by_gender = serializers.DictField(child=serializers.IntegerField())
+    patients_by_gender = serializers.DictField(child=serializers.IntegerField(), required=False)
     
     # Top Performers
-    top_funded_patients = serializers.ListField(child=serializers.DictField())
-    top_donors = serializers.ListField(child=serializers.DictField())
-    recent_donations = serializers.ListField(child=serializers.DictField())
+    top_funded_patients = serializers.ListField(child=serializers.DictField(), required=False)
+    top_donors = serializers.ListField(child=serializers.DictField(), required=False)
+    recent_donations = serializers.ListField(child=serializers.DictField(), required=False)
     
     # Trends (Last 30 days)
-    daily_donations_trend = serializers.ListField(child=serializers.DictField())
-    daily_registrations_trend = serializers.ListField(child=serializers.DictField())
+    daily_donations_trend = serializers.ListField(child=serializers.DictField(), required=False)
+    daily_registrations_trend = serializers.ListField(child=serializers.DictField(), required=False)
 
 
 class AdminDashboardStatsView(APIView):
@@ -123,339 +178,262 @@ class AdminDashboardStatsView(APIView):
                 type=openapi.TYPE_STRING,
                 format=openapi.FORMAT_DATE
             ),
+            openapi.Parameter(
+                'sections',
+                openapi.IN_QUERY,
+                description="Comma-separated blocks to compute (default: all). One or more of: " + ', '.join(DASHBOARD_SECTIONS),
+                type=openapi.TYPE_STRING
+            ),
         ],
         responses={
             200: openapi.Response('Dashboard statistics', AdminDashboardStatsSerializer),
+            400: 'None of the requested sections exist',
             403: 'Forbidden - Admin access required'
         }
     )
     def get(self, request):
+        requested = {name.strip() for name in request.GET.get('sections', 'all').split(',') if name.strip()}
+        if not requested or 'all' in requested:
+            sections = frozenset(DASHBOARD_SECTIONS)
+        else:
+            sections = frozenset(requested.intersection(DASHBOARD_SECTIONS))
+            if not sections:
+                return Response(
+                    {'error': 'Unknown sections. Use one or more of: ' + ', '.join(DASHBOARD_SECTIONS)},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        # The payload depends only on the sections, so they alone make up the key
+        cache_key = 'admin_dashboard_stats:v2:{}'.format(','.join(sorted(sections)))
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._compute_stats(sections)
+            cache.set(cache_key, data, DASHBOARD_CACHE_TIMEOUT)
+        return Response(data)
+    
+    def _compute_stats(self, sections):
+        """Run the queries for the requested sections and return the serialized payload"""
         now = timezone.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        # "Today" is the local calendar day, matching the TruncDate buckets of DailyStats
+        today_start = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
         week_ago = now - timedelta(days=7)
         month_ago = now - timedelta(days=30)
+        today = timezone.localdate(now)
         
-        # ===== USER OVERVIEW =====
-        total_users = CustomUser.objects.count()
-        total_patients = CustomUser.objects.filter(user_type='PATIENT').count()
-        total_donors = CustomUser.objects.filter(user_type='DONOR').count()
-        total_admins = CustomUser.objects.filter(user_type='ADMIN').count()
-        active_users = CustomUser.objects.filter(is_active=True).count()
-        verified_users = CustomUser.objects.filter(is_verified=True).count()
+        def wants(*names):
+            return not sections.isdisjoint(names)
         
-        # ===== PATIENT STATISTICS =====
-        patients_submitted = PatientProfile.objects.filter(status='SUBMITTED').count()
-        patients_published = PatientProfile.objects.filter(status='PUBLISHED').count()
-        patients_fully_funded = PatientProfile.objects.filter(status='FULLY_FUNDED').count()
-        patients_featured = PatientProfile.objects.filter(is_featured=True).count()
-        patients_pending_review = PatientProfile.objects.filter(
-            status='SUBMITTED'
-        ).count()
+        # Base queryset shared by every donation query below
+        completed_donations = Donation.objects.filter(status='COMPLETED')
         
-        # ===== DONOR STATISTICS =====
-        active_donors = DonorProfile.objects.filter(user__is_active=True).count()
-        total_donations_count = Donation.objects.filter(status='COMPLETED').count()
-        unique_donors_count = Donation.objects.filter(
-            status='COMPLETED'
-        ).values('donor').distinct().count()
+        # Only the date windows vary per request
+        new_since = _new_since_aggregates(today_start, week_ago, month_ago)
         
-        # ===== CAMPAIGN STATISTICS =====
-        total_campaigns = Campaign.objects.count()
-        active_campaigns = Campaign.objects.filter(
-            status='ACTIVE',
-            end_date__gte=now
-        ).count()
-        completed_campaigns = Campaign.objects.filter(status='COMPLETED').count()
+        stats_data = {}
         
-        # ===== FINANCIAL STATISTICS =====
-        funding_stats = PatientProfile.objects.aggregate(
-            total_goal=Sum('funding_required'),
-            total_raised=Sum('funding_received')
-        )
-        
-        donation_stats = Donation.objects.filter(status='COMPLETED').aggregate(
-            total_amount=Sum('amount'),
-            avg_amount=Avg('amount'),
-            count=Count('id')
-        )
-        
-        total_funding_goal = funding_stats['total_goal'] or 0
-        total_funding_raised = funding_stats['total_raised'] or 0
-        total_donations_amount = donation_stats['total_amount'] or 0
-        average_donation_amount = donation_stats['avg_amount'] or 0
+        # ===== USER OVERVIEW =====
+        if wants('overview'):
+            user_stats = CustomUser.objects.aggregate(**USER_OVERVIEW_AGGREGATES)
+            stats_data.update({
+                'total_users': user_stats['total'],
+                'total_patients': user_stats['patients'],
+                'total_donors': user_stats['donors'],
+                'total_admins': user_stats['admins'],
+                'active_users': user_stats['active'],
+                'verified_users': user_stats['verified'],
+            })
         
-        overall_funding_percentage = (
-            (float(total_funding_raised) / float(total_funding_goal) * 100)
-            if total_funding_goal > 0 else 0
-        )
+        # ===== PATIENT STATISTICS =====
+        if wants('patients', 'financial', 'activity'):
+            patient_stats = PatientProfile.objects.aggregate(**PATIENT_TOTALS_AGGREGATES, **new_since)
         
-        # ===== RECENT ACTIVITY - THIS MONTH =====
-        new_patients_this_month = PatientProfile.objects.filter(
-            created_at__gte=month_ago
-        ).count()
-        new_donors_this_month = DonorProfile.objects.filter(
-            created_at__gte=month_ago
-        ).count()
-        donations_this_month = Donation.objects.filter(
-            status='COMPLETED',
-            created_at__gte=month_ago
-        ).count()
-        donations_amount_this_month = Donation.objects.filter(
-            status='COMPLETED',
-            created_at__gte=month_ago
-        ).aggregate(total=Sum('amount'))['total'] or 0
+        # ===== DONOR STATISTICS =====
+        if wants('activity'):
+            donor_stats = DonorProfile.objects.aggregate(**new_since)
+        if wants('donors', 'financial', 'activity'):
+            donation_stats = completed_donations.aggregate(
+                count_today=Count('id', filter=Q(created_at__gte=today_start)),
+                amount_today=Sum('amount', filter=Q(created_at__gte=today_start)),
+                count_week=Count('id', filter=Q(created_at__gte=week_ago)),
+                amount_week=Sum('amount', filter=Q(created_at__gte=week_ago)),
+                count_month=Count('id', filter=Q(created_at__gte=month_ago)),
+                amount_month=Sum('amount', filter=Q(created_at__gte=month_ago)),
+                **DONATION_TOTALS_AGGREGATES,
+            )
         
-        # ===== RECENT ACTIVITY - THIS WEEK =====
-        new_patients_this_week = PatientProfile.objects.filter(
-            created_at__gte=week_ago
-        ).count()
-        new_donors_this_week = DonorProfile.objects.filter(
-            created_at__gte=week_ago
-        ).count()
-        donations_this_week = Donation.objects.filter(
-            status='COMPLETED',
-            created_at__gte=week_ago
-        ).count()
-        donations_amount_this_week = Donation.objects.filter(
-            status='COMPLETED',
-            created_at__gte=week_ago
-        ).aggregate(total=Sum('amount'))['total'] or 0
+        if wants('patients'):
+            stats_data.update({
+                'patients_submitted': patient_stats['submitted'],
+                'patients_published': patient_stats['published'],
+                'patients_fully_funded': patient_stats['funded'],
+                'patients_featured': patient_stats['featured'],
+                # Pending review is the same set as submitted
+                'patients_pending_review': patient_stats['submitted'],
+            })
         
-        # ===== RECENT ACTIVITY - TODAY =====
-        new_patients_today = PatientProfile.objects.filter(
-            created_at__gte=today_start
-        ).count()
-        new_donors_today = DonorProfile.objects.filter(
-            created_at__gte=today_start
-        ).count()
-        donations_today = Donation.objects.filter(
-            status='COMPLETED',
-            created_at__gte=today_start
-        ).count()
-        donations_amount_today = Donation.objects.filter(
-            status='COMPLETED',
-            created_at__gte=today_start
-        ).aggregate(total=Sum('amount'))['total'] or 0
+        if wants('donors'):
+            stats_data.update({
+                'active_donors': DonorProfile.objects.filter(user_is_active=True).count(),
+                'total_donations_count': donation_stats['total_count'],
+                'unique_donors_count': completed_donations.values('donor').distinct().count(),
+            })
         
-        # ===== BREAKDOWN BY COUNTRY =====
-        patients_by_country = dict(
-            PatientProfile.objects.filter(country_fk__isnull=False)
-            .values('country_fk__name')
-            .annotate(count=Count('id'))
-            .values_list('country_fk__name', 'count')
-        )
+        # ===== CAMPAIGN STATISTICS =====
+        if wants('campaigns'):
+            campaign_stats = Campaign.objects.aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(status='ACTIVE', end_date__gte=now)),
+                completed=Count('id', filter=Q(status='COMPLETED')),
+            )
+            stats_data.update({
+                'total_campaigns': campaign_stats['total'],
+                'active_campaigns': campaign_stats['active'],
+                'completed_campaigns': campaign_stats['completed'],
+            })
         
-        donors_by_country = dict(
-            DonorProfile.objects.filter(country_fk__isnull=False)
-            .values('country_fk__name')
-            .annotate(count=Count('id'))
-            .values_list('country_fk__name', 'count')
-        )
+        if wants('financial'):
+            stats_data.update({
+                'total_funding_goal': patient_stats['total_goal'] or 0,
+                'total_funding_raised': patient_stats['total_raised'] or 0,
+                'total_donations_amount': donation_stats['total_amount'] or 0,
+                'average_donation_amount': donation_stats['avg_amount'] or 0,
+                'overall_funding_percentage': patient_stats['funding_percentage'],
+            })
         
-        # ===== BREAKDOWN BY STATUS =====
-        patients_by_status = dict(
-            PatientProfile.objects.values('status')
-            .annotate(count=Count('id'))
-            .values_list('status', 'count')
-        )
+        if wants('activity'):
+            stats_data.update({
+                # This Month
+                'new_patients_this_month': patient_stats['new_month'],
+                'new_donors_this_month': donor_stats['new_month'],
+                'donations_this_month': donation_stats['count_month'],
+                'donations_amount_this_month': donation_stats['amount_month'] or 0,
+                
+                # This Week
+                'new_patients_this_week': patient_stats['new_week'],
+                'new_donors_this_week': donor_stats['new_week'],
+                'donations_this_week': donation_stats['count_week'],
+                'donations_amount_this_week': donation_stats['amount_week'] or 0,
+                
+                # Today
+                'new_patients_today': patient_stats['new_today'],
+                'new_donors_today': donor_stats['new_today'],
+                'donations_today': donation_stats['count_today'],
+                'donations_amount_today': donation_stats['amount_today'] or 0,
+            })
         
-        # ===== BREAKDOWN BY GENDER =====
-        patients_by_gender = dict(
-            PatientProfile.objects.values('gender')
-            .annotate(count=Count('id'))
-            .values_list('gender', 'count')
-        )
+        if wants('breakdowns'):
+            # ===== BREAKDOWN BY COUNTRY =====
+            # Served from the CountryStats roll-up (rebuilt nightly)
+            country_stats = CountryStats.objects.values_list('country__name', 'patient_count', 'donor_count')
+            
+            stats_data.update({
+                'patients_by_country': {name: patients for name, patients, _ in country_stats if patients},
+                'donors_by_country': {name: donors for name, _, donors in country_stats if donors},
+                
+                # ===== BREAKDOWN BY STATUS =====
+                'patients_by_status': dict(
+                    PatientProfile.objects.values('status')
+                    .annotate(count=Count('id'))
+                    .values_list('status', 'count')
+                ),
+                
+                # ===== BREAKDOWN BY GENDER =====
+                'patients_by_gender': dict(
+                    PatientProfile.objects.values('gender')
+                    .annotate(count=Count('id'))
+                    .values_list('gender', 'count')
+                ),
+            })
         
         # ===== TOP PERFORMERS =====
-        # Top 5 funded patients
-        top_funded_patients = list(
-            PatientProfile.objects.filter(funding_received__gt=0)
-            .order_by('-funding_received')[:5]
-            .values(
-                'id', 
-                'full_name', 
-                'funding_received', 
-                'funding_required',
-                'country_fk__name'
+        if wants('top_performers'):
+            # Top funded patients
+            top_funded_patients = list(
+                PatientProfile.objects.filter(funding_received__gt=0)
+                .order_by('-funding_received')
+                .values(
+                    'id',
+                    'full_name',
+                    'funding_received',
+                    'funding_required',
+                    country=F('country_fk__name'),
+                    funding_percentage=Coalesce(
+                        Cast('funding_received', FloatField()) * 100
+                        / NullIf(Cast('funding_required', FloatField()), 0.0),
+                        0.0
+                    )
+                )[:TOP_FUNDED_PATIENTS_LIMIT]
             )
-        )
-        
-        # Calculate percentage for each
-        for patient in top_funded_patients:
-            patient['funding_percentage'] = (
-                (float(patient['funding_received']) / float(patient['funding_required']) * 100)
-                if patient['funding_required'] > 0 else 0
-            )
-            patient['country'] = patient.pop('country_fk__name')
-        
-        # Top 5 donors by total donations
-        top_donors = list(
-            Donation.objects.filter(status='COMPLETED', donor__isnull=False)
-            .values('donor__first_name', 'donor__last_name', 'donor__email')
-            .annotate(
-                total_donated=Sum('amount'),
-                donation_count=Count('id')
+            
+            # Top donors by total donations
+            top_donors = list(
+                completed_donations.filter(donor__isnull=False)
+                .values(
+                    name=Trim(Concat('donor__first_name', Value(' '), 'donor__last_name')),
+                    email=F('donor__email')
+                )
+                .annotate(
+                    total_donated=Sum('amount'),
+                    donation_count=Count('id')
+                )
+                .order_by('-total_donated')[:TOP_DONORS_LIMIT]
             )
-            .order_by('-total_donated')[:5]
-        )
-        
-        # Format donor names
-        for donor in top_donors:
-            donor['name'] = f"{donor.pop('donor__first_name', '')} {donor.pop('donor__last_name', '')}".strip()
-            donor['email'] = donor.pop('donor__email')
-        
-        # Recent 10 donations
-        recent_donations = list(
-            Donation.objects.filter(status='COMPLETED')
-            .select_related('donor', 'patient')
-            .order_by('-created_at')[:10]
-            .values(
-                'id',
-                'amount',
-                'created_at',
-                'donor__first_name',
-                'donor__last_name',
-                'patient__full_name',
-                'payment_method'
+            
+            # Most recent donations
+            recent_donations = list(
+                completed_donations
+                .order_by('-created_at')
+                .values(
+                    'id',
+                    'amount',
+                    'created_at',
+                    'payment_method',
+                    donor_name=Trim(Concat('donor__first_name', Value(' '), 'donor__last_name')),
+                    patient_name=F('patient__full_name')
+                )[:RECENT_DONATIONS_LIMIT]
             )
-        )
-        
-        # Format recent donations
-        for donation in recent_donations:
-            donation['donor_name'] = f"{donation.pop('donor__first_name', '')} {donation.pop('donor__last_name', '')}".strip()
-            donation['patient_name'] = donation.pop('patient__full_name')
+            
+            stats_data.update({
+                'top_funded_patients': top_funded_patients,
+                'top_donors': top_donors,
+                'recent_donations': recent_donations,
+            })
         
         # ===== TRENDS - LAST 30 DAYS =====
-        # Daily donations trend
-        daily_donations = Donation.objects.filter(
-            status='COMPLETED',
-            created_at__gte=month_ago
-        ).extra(
-            select={'date': 'DATE(created_at)'}
-        ).values('date').annotate(
-            count=Count('id'),
-            total_amount=Sum('amount')
-        ).order_by('date')
-        
-        daily_donations_trend = [
-            {
-                'date': item['date'].isoformat() if hasattr(item['date'], 'isoformat') else str(item['date']),
-                'count': item['count'],
-                'amount': float(item['total_amount'] or 0)
-            }
-            for item in daily_donations
-        ]
-        
-        # Daily registrations trend
-        daily_patients = PatientProfile.objects.filter(
-            created_at__gte=month_ago
-        ).extra(
-            select={'date': 'DATE(created_at)'}
-        ).values('date').annotate(
-            patient_count=Count('id')
-        ).order_by('date')
-        
-        daily_donors = DonorProfile.objects.filter(
-            created_at__gte=month_ago
-        ).extra(
-            select={'date': 'DATE(created_at)'}
-        ).values('date').annotate(
-            donor_count=Count('id')
-        ).order_by('date')
-        
-        # Combine into daily registrations
-        registrations_by_date = {}
-        for item in daily_patients:
-            date_str = item['date'].isoformat() if hasattr(item['date'], 'isoformat') else str(item['date'])
-            registrations_by_date[date_str] = {
-                'date': date_str,
-                'patients': item['patient_count'],
-                'donors': 0
-            }
-        
-        for item in daily_donors:
-            date_str = item['date'].isoformat() if hasattr(item['date'], 'isoformat') else str(item['date'])
-            if date_str in registrations_by_date:
-                registrations_by_date[date_str]['donors'] = item['donor_count']
-            else:
-                registrations_by_date[date_str] = {
-                    'date': date_str,
-                    'patients': 0,
-                    'donors': item['donor_count']
-                }
-        
-        daily_registrations_trend = sorted(
-            registrations_by_date.values(),
-            key=lambda x: x['date']
-        )
-        
-        # ===== COMPILE ALL STATS =====
-        stats_data = {
-            # Overview
-            'total_users': total_users,
-            'total_patients': total_patients,
-            'total_donors': total_donors,
-            'total_admins': total_admins,
-            'active_users': active_users,
-            'verified_users': verified_users,
-            
-            # Patients
-            'patients_submitted': patients_submitted,
-            'patients_published': patients_published,
-            'patients_fully_funded': patients_fully_funded,
-            'patients_featured': patients_featured,
-            'patients_pending_review': patients_pending_review,
-            
-            # Donors
-            'active_donors': active_donors,
-            'total_donations_count': total_donations_count,
-            'unique_donors_count': unique_donors_count,
-            
-            # Campaigns
-            'total_campaigns': total_campaigns,
-            'active_campaigns': active_campaigns,
-            'completed_campaigns': completed_campaigns,
-            
-            # Financial
-            'total_funding_goal': total_funding_goal,
-            'total_funding_raised': total_funding_raised,
-            'total_donations_amount': total_donations_amount,
-            'average_donation_amount': average_donation_amount,
-            'overall_funding_percentage': overall_funding_percentage,
+        if wants('trends'):
+            trend_start = timezone.localdate(month_ago)
+            # Closed days come from the DailyStats roll-up, already shaped as trend entries
+            # (dates are ISO-formatted by the renderer). The day of the last roll-up run was
+            # only partly over when it ran, so that day onwards is computed live
+            last_rollup = DailyStats.objects.aggregate(last=Max('updated_at'))['last']
+            live_from = trend_start
+            if last_rollup:
+                live_from = min(max(timezone.localdate(last_rollup), trend_start), today)
+            rolled_up = DailyStats.objects.filter(date__gte=trend_start, date__lt=live_from)
+            live_rows = sorted(DailyStats.compute_rows(live_from, today).items())
             
-            # This Month
-            'new_patients_this_month': new_patients_this_month,
-            'new_donors_this_month': new_donors_this_month,
-            'donations_this_month': donations_this_month,
-            'donations_amount_this_month': donations_amount_this_month,
-            
-            # This Week
-            'new_patients_this_week': new_patients_this_week,
-            'new_donors_this_week': new_donors_this_week,
-            'donations_this_week': donations_this_week,
-            'donations_amount_this_week': donations_amount_this_week,
-            
-            # Today
-            'new_patients_today': new_patients_today,
-            'new_donors_today': new_donors_today,
-            'donations_today': donations_today,
-            'donations_amount_today': donations_amount_today,
-            
-            # Breakdowns
-            'patients_by_country': patients_by_country,
-            'donors_by_country': donors_by_country,
-            'patients_by_status': patients_by_status,
-            'patients_by_gender': patients_by_gender,
+            daily_donations_trend = list(
+                rolled_up.filter(donations_count__gt=0)
+                .values('date', count=F('donations_count'), amount=F('donations_amount'))
+            )
+            daily_donations_trend += [
+                {'date': day, 'count': row['donations_count'], 'amount': row['donations_amount']}
+                for day, row in live_rows if row['donations_count']
+            ]
             
-            # Top Performers
-            'top_funded_patients': top_funded_patients,
-            'top_donors': top_donors,
-            'recent_donations': recent_donations,
+            daily_registrations_trend = list(
+                rolled_up.filter(Q(new_patients__gt=0) | Q(new_donors__gt=0))
+                .values('date', patients=F('new_patients'), donors=F('new_donors'))
+            )
+            daily_registrations_trend += [
+                {'date': day, 'patients': row['new_patients'], 'donors': row['new_donors']}
+                for day, row in live_rows if row['new_patients'] or row['new_donors']
+            ]
             
-            # Trends
-            'daily_donations_trend': daily_donations_trend,
-            'daily_registrations_trend': daily_registrations_trend,
-        }
+            stats_data.update({
+                'daily_donations_trend': daily_donations_trend,
+                'daily_registrations_trend': daily_registrations_trend,
+            })
         
         serializer = AdminDashboardStatsSerializer(stats_data)
-        return Response(serializer.data)
+        return dict(serializer.data)
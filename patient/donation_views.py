@@ -1,7 +1,12 @@
+from decimal import Decimal, ROUND_HALF_UP
+
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.db import connection, transaction
+from django.db.models import F
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -10,6 +15,17 @@ from .models import PatientProfile, DonationAmountOption
 from .serializers import DonationAmountOptionSerializer, DonationAmountOptionCreateSerializer
 
 
+_ONE = Decimal('1')
+_FIVE = Decimal('5')
+_TEN = Decimal('10')
+
+
+def _round_step(amount):
+    """Round a suggested amount to the nearest $5 (under $50) or $10"""
+    step = _FIVE if amount < 50 else _TEN
+    return (amount / step).quantize(_ONE, rounding=ROUND_HALF_UP) * step
+
+
 # ============ PUBLIC/DONOR ENDPOINTS ============
 
 class PatientDonationAmountsView(generics.ListAPIView):
@@ -19,6 +35,7 @@ class PatientDonationAmountsView(generics.ListAPIView):
     """
     serializer_class = DonationAmountOptionSerializer
     permission_classes = []  # Public access
+    pagination_class = None  # A handful of options; one query, no COUNT
     
     @swagger_auto_schema(
         operation_summary="Get Patient Donation Amount Options",
@@ -83,16 +100,16 @@ class AdminDonationAmountListCreateView(generics.ListCreateAPIView):
         patient_id = self.kwargs.get('patient_id')
         
         # Verify patient exists
-        get_object_or_404(PatientProfile, id=patient_id)
+        if not PatientProfile.objects.filter(id=patient_id).exists():
+            raise Http404('Patient not found')
         
         # Create serializer with patient_id
         serializer = DonationAmountOptionCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save(patient_profile_id=patient_id)
         
-        # Return with full serializer
-        output_serializer = DonationAmountOptionSerializer(serializer.instance)
-        return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+        # The create serializer already renders the full representation
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
     
     def get_queryset(self):
         patient_id = self.kwargs.get('patient_id')
@@ -161,6 +178,12 @@ class AdminDonationAmountDetailView(generics.RetrieveUpdateDestroyAPIView):
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
     
+    def get_serializer_class(self):
+        # Writes go through the bounds-checked serializer so bad input is a 400, not a constraint error
+        if self.request.method in ('PUT', 'PATCH'):
+            return DonationAmountOptionCreateSerializer
+        return DonationAmountOptionSerializer
+    
     def get_queryset(self):
         patient_id = self.kwargs.get('patient_id')
         return DonationAmountOption.objects.filter(patient_profile_id=patient_id)
@@ -206,13 +229,14 @@ class AdminBulkCreateDonationAmountsView(APIView):
         }
     )
     def post(self, request, patient_id):
-        from decimal import Decimal
-        
-        # Get patient
-        patient = get_object_or_404(PatientProfile, id=patient_id)
-        
-        # Calculate remaining funding
-        remaining = patient.funding_required - patient.funding_received
+        # Get patient, with remaining funding calculated in the query
+        patient = get_object_or_404(
+            PatientProfile.objects.only('id').annotate(
+                remaining=F('funding_required') - F('funding_received')
+            ),
+            id=patient_id
+        )
+        remaining = patient.remaining
         
         if remaining <= 0:
             return Response(
@@ -220,9 +244,6 @@ class AdminBulkCreateDonationAmountsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Clear existing amounts (optional - can be made configurable)
-        DonationAmountOption.objects.filter(patient_profile=patient).delete()
-        
         # Create 4 suggested amounts
         amounts = [
             (remaining * Decimal('0.01'), 1, False),  # ~1% of remaining
@@ -231,23 +252,40 @@ class AdminBulkCreateDonationAmountsView(APIView):
             (remaining * Decimal('0.15'), 4, True),   # ~15% of remaining (recommended)
         ]
         
-        created_options = []
+        # Keyed by amount: small goals can round several percentages to the same value
+        new_options = {}
         for amount, order, is_recommended in amounts:
             # Round to nearest $5 or $10
-            if amount < 50:
-                rounded_amount = round(amount / 5) * 5
-            else:
-                rounded_amount = round(amount / 10) * 10
+            rounded_amount = _round_step(amount)
             
             if rounded_amount > 0:
-                option = DonationAmountOption.objects.create(
+                new_options[rounded_amount] = DonationAmountOption(
                     patient_profile=patient,
-                    amount=Decimal(str(rounded_amount)),
+                    amount=rounded_amount,
                     display_order=order,
                     is_active=True,
                     is_recommended=is_recommended
                 )
-                created_options.append(option)
+        
+        # Upsert on the (patient, amount, currency) unique key so options whose amount is
+        # unchanged keep their row, then drop the ones no longer suggested
+        upsert = {
+            'update_conflicts': True,
+            'update_fields': ['display_order', 'is_active', 'is_recommended', 'updated_at'],
+        }
+        # MySQL's ON DUPLICATE KEY UPDATE takes no conflict target
+        if connection.features.supports_update_conflicts_with_target:
+            upsert['unique_fields'] = ['patient_profile', 'amount', 'currency']
+        
+        with transaction.atomic():
+            DonationAmountOption.objects.bulk_create(list(new_options.values()), **upsert)
+            # Re-select the upserted rows: not every backend returns primary keys from bulk_create
+            patient_options = DonationAmountOption.objects.filter(patient_profile=patient)
+            created_options = list(patient_options.filter(
+                amount__in=list(new_options),
+                currency__in={option.currency for option in new_options.values()},
+            ).order_by('display_order', 'amount'))
+            patient_options.exclude(id__in=[option.id for option in created_options]).delete()
         
         # Serialize results
         serializer = DonationAmountOptionSerializer(created_options, many=True)
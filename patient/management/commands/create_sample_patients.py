@@ -1,7 +1,11 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from auth_app.lookups import CountryLookup
 from patient.models import PatientProfile, ExpenseTypeLookup, TreatmentCostBreakdown, PatientTimeline
 from datetime import date, timedelta
+from decimal import Decimal
 
 User = get_user_model()
 
@@ -9,6 +13,7 @@ User = get_user_model()
 class Command(BaseCommand):
     help = 'Create sample patient data for testing'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write('Creating sample patients...')
         
@@ -133,71 +138,116 @@ class Command(BaseCommand):
             },
         ]
         
-        created_count = 0
-        for patient_data in patients_data:
-            # Create user
-            user, user_created = User.objects.get_or_create(
+        # Resolve the breakdown expense types once instead of per patient
+        et_map = {
+            et.slug: et for et in ExpenseTypeLookup.objects.filter(
+                slug__in=['hospital-fees', 'medical-staff', 'medication']
+            )
+        }
+        
+        countries = {
+            c.name: c for c in CountryLookup.objects.filter(
+                name__in={p['country'] for p in patients_data}
+            )
+        }
+        
+        # Create missing users (one SELECT + one INSERT)
+        emails = [p['email'] for p in patients_data]
+        existing_emails = set(User.objects.filter(email__in=emails).values_list('email', flat=True))
+        password = make_password('password123')
+        User.objects.bulk_create([
+            User(
                 email=patient_data['email'],
-                defaults={
-                    'user_type': 'PATIENT',
-                    'first_name': patient_data['first_name'],
-                    'last_name': patient_data['last_name'],
-                    'date_of_birth': patient_data['date_of_birth'],
-                    'is_active': True,
-                    'is_verified': True,
-                    'is_patient_verified': True,
-                }
+                user_type='PATIENT',
+                first_name=patient_data['first_name'],
+                last_name=patient_data['last_name'],
+                date_of_birth=patient_data['date_of_birth'],
+                is_active=True,
+                is_verified=True,
+                is_patient_verified=True,
+                password=password,
             )
-            
-            if user_created:
-                user.set_password('password123')
-                user.save()
-            
-            # Create patient profile
-            profile, profile_created = PatientProfile.objects.get_or_create(
+            for patient_data in patients_data
+            if patient_data['email'] not in existing_emails
+        ])
+        users = {u.email: u for u in User.objects.filter(email__in=emails)}
+        
+        # Create missing patient profiles
+        # bulk_create skips save() and post_save, so the bill identifier and the
+        # PROFILE_SUBMITTED timeline event are set here
+        users_with_profile = set(
+            PatientProfile.objects.filter(user__in=users.values()).values_list('user_id', flat=True)
+        )
+        new_profiles = []
+        for patient_data in patients_data:
+            user = users[patient_data['email']]
+            if user.id in users_with_profile:
+                continue
+            profile = PatientProfile(
                 user=user,
-                defaults={
-                    'full_name': patient_data['full_name'],
-                    'gender': patient_data['gender'],
-                    'country': patient_data['country'],
-                    'short_description': patient_data['short_description'],
-                    'long_story': patient_data['long_story'],
-                    'medical_partner': patient_data['medical_partner'],
-                    'diagnosis': patient_data['diagnosis'],
-                    'treatment_needed': patient_data['treatment_needed'],
-                    'treatment_date': patient_data['treatment_date'],
-                    'funding_required': patient_data['funding_required'],
-                    'funding_received': patient_data['funding_received'],
-                    'total_treatment_cost': patient_data['total_treatment_cost'],
-                    'status': patient_data['status'],
-                    'is_featured': patient_data['is_featured'],
-                }
+                full_name=patient_data['full_name'],
+                gender=patient_data['gender'],
+                country_fk=countries.get(patient_data['country']),
+                short_description=patient_data['short_description'],
+                long_story=patient_data['long_story'],
+                medical_partner=patient_data['medical_partner'],
+                diagnosis=patient_data['diagnosis'],
+                treatment_needed=patient_data['treatment_needed'],
+                treatment_date=patient_data['treatment_date'],
+                funding_required=patient_data['funding_required'],
+                funding_received=patient_data['funding_received'],
+                total_treatment_cost=patient_data['total_treatment_cost'],
+                status=patient_data['status'],
+                is_featured=patient_data['is_featured'],
             )
-            
-            if profile_created:
-                created_count += 1
-                self.stdout.write(f'Created patient: {patient_data["full_name"]}')
-                
-                # Create cost breakdown
-                hospital_fees = ExpenseTypeLookup.objects.get(slug='hospital-fees')
-                medical_staff = ExpenseTypeLookup.objects.get(slug='medical-staff')
-                medication = ExpenseTypeLookup.objects.get(slug='medication')
-                
-                TreatmentCostBreakdown.objects.create(
+            new_profiles.append(profile)
+        codes = PatientProfile.generate_bill_identifiers([profile.full_name for profile in new_profiles])
+        for profile, code in zip(new_profiles, codes):
+            profile.bill_identifier = code
+        PatientProfile.objects.bulk_create(new_profiles)
+        # Re-fetch by user: MySQL returns no primary keys from bulk_create, and the
+        # timeline and breakdown rows below need them
+        new_profiles = list(
+            PatientProfile.objects.filter(user__in=[profile.user for profile in new_profiles]).order_by('id')
+        )
+        
+        PatientTimeline.objects.bulk_create([
+            PatientTimeline(
+                patient_profile=profile,
+                event_type='PROFILE_SUBMITTED',
+                title='Profile Submitted',
+                description=f'{profile.full_name} has submitted their profile for review.',
+                is_milestone=True,
+                is_visible=True,
+                is_current_state=True
+            )
+            for profile in new_profiles
+        ])
+        
+        # Create cost breakdown
+        breakdowns = []
+        for profile in new_profiles:
+            self.stdout.write(f'Created patient: {profile.full_name}')
+            breakdowns.extend([
+                TreatmentCostBreakdown(
                     patient_profile=profile,
-                    expense_type=hospital_fees,
-                    amount=patient_data['funding_required'] * 0.5
-                )
-                TreatmentCostBreakdown.objects.create(
+                    expense_type=et_map['hospital-fees'],
+                    amount=profile.funding_required * Decimal('0.5')
+                ),
+                TreatmentCostBreakdown(
                     patient_profile=profile,
-                    expense_type=medical_staff,
-                    amount=patient_data['funding_required'] * 0.3
-                )
-                TreatmentCostBreakdown.objects.create(
+                    expense_type=et_map['medical-staff'],
+                    amount=profile.funding_required * Decimal('0.3')
+                ),
+                TreatmentCostBreakdown(
                     patient_profile=profile,
-                    expense_type=medication,
-                    amount=patient_data['funding_required'] * 0.2
-                )
+                    expense_type=et_map['medication'],
+                    amount=profile.funding_required * Decimal('0.2')
+                ),
+            ])
+        TreatmentCostBreakdown.objects.bulk_create(breakdowns, batch_size=500)
+    
+        created_count = len(new_profiles)
         
         self.stdout.write(self.style.SUCCESS(f'\n✓ Successfully created {created_count} patients'))
         self.stdout.write(self.style.SUCCESS(f'✓ Total patients in database: {PatientProfile.objects.count()}'))
@@ -2,6 +2,9 @@ from django.core.management.base import BaseCommand
 from patient.models import PatientProfile
 
 
+BATCH_SIZE = 500
+
+
 class Command(BaseCommand):
     help = 'Generate bill identifiers for patients without one'
 
@@ -27,19 +30,19 @@ class Command(BaseCommand):
         if dry_run:
             self.stdout.write(self.style.WARNING('DRY RUN MODE - No changes will be saved'))
         
+        # Stream the rows (dry run included) and handle them in batches: one uniqueness query
+        # and one UPDATE per batch instead of per patient; generation only reads full_name
+        patients = patients.only('id', 'full_name').iterator(chunk_size=BATCH_SIZE)
+        
         count = 0
+        batch = []
         for patient in patients:
-            if dry_run:
-                # Generate code without saving
-                code = patient._generate_bill_identifier()
-                self.stdout.write(f"Would generate: {code} for {patient.full_name}")
-            else:
-                # Save triggers auto-generation
-                patient.save()
-                count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(f"✓ Generated {patient.bill_identifier} for {patient.full_name}")
-                )
+            batch.append(patient)
+            if len(batch) >= BATCH_SIZE:
+                count += self._process_batch(batch, dry_run)
+                batch = []
+        if batch:
+            count += self._process_batch(batch, dry_run)
         
         if dry_run:
             self.stdout.write(self.style.WARNING(f'DRY RUN: Would generate {total_count} bill identifiers'))
@@ -47,3 +50,18 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully generated {count} bill identifiers')
             )
+    
+    def _process_batch(self, batch, dry_run):
+        codes = PatientProfile.generate_bill_identifiers([patient.full_name for patient in batch])
+        for patient, code in zip(batch, codes):
+            if dry_run:
+                # Generate code without saving
+                self.stdout.write(f"Would generate: {code} for {patient.full_name}")
+                continue
+            patient.bill_identifier = code
+            self.stdout.write(
+                self.style.SUCCESS(f"✓ Generated {patient.bill_identifier} for {patient.full_name}")
+            )
+        if dry_run:
+            return 0
+        return PatientProfile.objects.bulk_update(batch, ['bill_identifier'])
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from patient.models import CountryStats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the CountryStats roll-up used by the admin dashboard country breakdowns (schedule nightly)'
+
+    def handle(self, *args, **options):
+        count = CountryStats.recompute()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt country stats for {count} country(ies)')
+        )
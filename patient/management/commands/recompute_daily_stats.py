@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from patient.models import DailyStats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the DailyStats roll-up used by the admin dashboard trends (schedule nightly, shortly after midnight in TIME_ZONE)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=31,
+            help='Number of past days to rebuild (default: 31)',
+        )
+
+    def handle(self, *args, **options):
+        end_date = timezone.localdate()
+        start_date = end_date - timedelta(days=options['days'])
+
+        count = DailyStats.recompute(start_date, end_date)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {count} daily stats row(s) from {start_date} to {end_date}')
+        )
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0008_patientprofile_bill_identifier'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(fields=['status', '-created_at'], include=('full_name', 'funding_required'), name='pp_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(fields=['country_fk', 'status'], name='pp_country_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['is_featured'], name='pp_featured_partial'),
+        ),
+    ]
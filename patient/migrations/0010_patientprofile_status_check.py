@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0009_patientprofile_admin_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='patientprofile',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['SUBMITTED', 'SCHEDULED', 'PUBLISHED', 'AWAITING_FUNDING', 'FULLY_FUNDED', 'TREATMENT_COMPLETE'])), name='pp_status_valid'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0010_patientprofile_status_check'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('date', models.DateField(primary_key=True, serialize=False)),
+                ('donations_count', models.PositiveIntegerField(default=0)),
+                ('donations_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('new_patients', models.PositiveIntegerField(default=0)),
+                ('new_donors', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Daily Stats',
+                'verbose_name_plural': 'Daily Stats',
+                'db_table': 'patient_dailystats',
+                'ordering': ['date'],
+            },
+        ),
+    ]
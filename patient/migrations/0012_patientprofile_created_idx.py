@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0011_dailystats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(fields=['created_at'], name='patient_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0012_patientprofile_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(fields=['-funding_received'], name='patient_funding_desc_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-16 12:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0012_financialreport_google_doc_url_and_more'),
+        ('patient', '0013_patientprofile_funding_desc_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CountryStats',
+            fields=[
+                ('country', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='auth_app.countrylookup')),
+                ('patient_count', models.PositiveIntegerField(default=0)),
+                ('donor_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Country Stats',
+                'verbose_name_plural': 'Country Stats',
+                'db_table': 'patient_countrystats',
+            },
+        ),
+    ]
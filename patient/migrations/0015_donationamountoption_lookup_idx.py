@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0014_countrystats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donationamountoption',
+            index=models.Index(fields=['patient_profile', 'is_active', 'display_order', 'amount'], name='don_opt_lookup_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0015_donationamountoption_lookup_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(fields=['status', 'is_featured', '-created_at'], name='patient_status_feat_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0016_patientprofile_status_feat_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patienttimeline',
+            index=models.Index(condition=models.Q(('is_current_state', True)), fields=['patient_profile'], name='timeline_current_state_idx'),
+        ),
+    ]
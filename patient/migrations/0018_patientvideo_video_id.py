@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-16 14:30
+
+import re
+
+from django.db import migrations, models
+
+
+# Same patterns as patient.models.YOUTUBE_ID_PATTERNS, frozen for this migration
+YOUTUBE_ID_PATTERNS = (
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)'),
+    re.compile(r'youtube\.com\/embed\/([^&\n?#]+)'),
+)
+
+
+def backfill_video_id(apps, schema_editor):
+    PatientVideo = apps.get_model('patient', 'PatientVideo')
+    videos = list(PatientVideo.objects.only('id', 'youtube_url'))
+    for video in videos:
+        for pattern in YOUTUBE_ID_PATTERNS:
+            match = pattern.search(video.youtube_url or '')
+            if match:
+                video.video_id = match.group(1)
+                break
+    PatientVideo.objects.bulk_update(videos, ['video_id'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0017_patienttimeline_current_state_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='patientvideo',
+            name='video_id',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(backfill_video_id, migrations.RunPython.noop),
+    ]
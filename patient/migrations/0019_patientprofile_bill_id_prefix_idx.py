@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0018_patientvideo_video_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(fields=['bill_identifier'], name='patient_bill_id_prefix_idx', opclasses=['text_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-16 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient', '0019_patientprofile_bill_id_prefix_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='donationamountoption',
+            constraint=models.CheckConstraint(condition=models.Q(('amount__gt', 0)), name='don_opt_amount_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='donationamountoption',
+            constraint=models.CheckConstraint(condition=models.Q(('display_order__gte', 0)), name='don_opt_display_order_gte_0'),
+        ),
+    ]
@@ -1,8 +1,75 @@
-from django.db import models
+import re
+import secrets
+import string
+from django.db import models, transaction, IntegrityError
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim, TruncDate
 from django.conf import settings
+from django.utils.functional import cached_property
 from datetime import date
+from decimal import Decimal
 from auth_app.lookups import CountryLookup
 from utils.constants import CURRENCY_CHOICES
+from utils.currency_choices import CURRENCY_SYMBOLS
+
+
+# Video ID extractors for the supported YouTube URL formats
+YOUTUBE_ID_PATTERNS = (
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)'),
+    re.compile(r'youtube\.com\/embed\/([^&\n?#]+)'),
+)
+
+
+class PatientProfileQuerySet(models.QuerySet):
+    def with_age_data(self):
+        """Join the user (for age) and country rows so rendering profiles needs no per-row queries"""
+        return self.select_related('user', 'country_fk')
+    
+    def with_funding_totals(self):
+        """Annotate the breakdown sum read by PatientProfile.cost_breakdown_total"""
+        return self.annotate(cost_breakdown_total_db=Sum('cost_breakdowns__amount'))
+    
+    def with_funding_received(self):
+        """Fill the funding_received_actual cache from a subquery instead of one aggregate per row"""
+        from donor.models import Donation
+        
+        completed = Donation.objects.filter(
+            patient=OuterRef('pk'), status='COMPLETED'
+        ).order_by().values('patient').annotate(total=Sum('patient_amount')).values('total')
+        # A subquery rather than a join, so it combines with other aggregate annotations
+        return self.annotate(funding_received_actual=Coalesce(
+            Subquery(completed), Value(Decimal('0.00')),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        ))
+    
+    def with_cost_breakdowns(self):
+        """Prefetch breakdown items together with their expense types, in display order"""
+        # Only the columns TreatmentCostBreakdownSerializer renders (and cost_breakdown_total sums)
+        breakdowns = TreatmentCostBreakdown.objects.select_related('expense_type').only(
+            'id', 'patient_profile_id', 'amount', 'notes', 'created_at',
+            'expense_type__id', 'expense_type__name', 'expense_type__slug',
+        ).order_by('expense_type__display_order')
+        return self.prefetch_related(models.Prefetch('cost_breakdowns', queryset=breakdowns))
+    
+    def with_timeline(self):
+        """Prefetch timeline events with their authors (rendered as created_by_name)"""
+        # Only the columns PatientTimelineSerializer renders
+        events = PatientTimeline.objects.only(
+            'id', 'patient_profile_id', 'event_type', 'title', 'description', 'created_by_id',
+            'metadata', 'is_milestone', 'is_visible', 'event_date', 'created_at',
+        ).with_created_by_name()
+        return self.prefetch_related(models.Prefetch('timeline_events', queryset=events))
+
+
+class PatientTimelineQuerySet(models.QuerySet):
+    def with_created_by_name(self):
+        """Annotate created_by_name ("First Last", else email) in SQL instead of loading the author row"""
+        full_name = Trim(Concat('created_by__first_name', Value(' '), 'created_by__last_name'))
+        return self.annotate(
+            created_by_name=Coalesce(
+                NullIf(full_name, Value('')), 'created_by__email', output_field=models.CharField()
+            )
+        )
 
 
 class PatientProfile(models.Model):
@@ -77,146 +144,262 @@ class PatientProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = PatientProfileQuerySet.as_manager()
+    
     class Meta:
         db_table = 'auth_app_patientprofile'  # Keep existing table name
+        indexes = [
+            # Admin list filters: status + created_at range; INCLUDE makes it covering on PostgreSQL
+            models.Index(
+                fields=['status', '-created_at'],
+                include=['full_name', 'funding_required'],
+                name='pp_status_created_idx',
+            ),
+            models.Index(fields=['country_fk', 'status'], name='pp_country_status_idx'),
+            models.Index(fields=['created_at'], name='patient_created_idx'),
+            # Top-funded listings read the first rows straight from the index instead of sorting
+            models.Index(fields=['-funding_received'], name='patient_funding_desc_idx'),
+            models.Index(
+                fields=['is_featured'],
+                condition=models.Q(is_featured=True),
+                name='pp_featured_partial',
+            ),
+            # Public/featured listings: status + featured flag, newest first
+            models.Index(fields=['status', 'is_featured', '-created_at'], name='patient_status_feat_idx'),
+            # USSD prefix lookups (bill_identifier__startswith); text_pattern_ops lets PostgreSQL
+            # use the index for LIKE 'PREFIX%' under non-C collations, other backends ignore it
+            models.Index(
+                fields=['bill_identifier'],
+                opclasses=['text_pattern_ops'],
+                name='patient_bill_id_prefix_idx',
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(status__in=[
+                    'SUBMITTED', 'SCHEDULED', 'PUBLISHED',
+                    'AWAITING_FUNDING', 'FULLY_FUNDED', 'TREATMENT_COMPLETE',
+                ]),
+                name='pp_status_valid',
+            ),
+        ]
         
     def __str__(self):
         return f"{self.full_name} - {self.status}"
     
+    # Attempts at a fresh bill_identifier when the generated one is already taken
+    BILL_IDENTIFIER_ATTEMPTS = 5
+    
     def save(self, *args, **kwargs):
         """Auto-generate bill_identifier if not set"""
-        if not self.bill_identifier:
-            self.bill_identifier = self._generate_bill_identifier()
-        super().save(*args, **kwargs)
-    
-    def _generate_bill_identifier(self):
-        """Generate unique bill identifier like: JIMMY-2024-001"""
-        import random
-        import string
-        from datetime import datetime
+        if self.bill_identifier:
+            super().save(*args, **kwargs)
+            return
         
-        # Get first name (uppercase, max 10 chars)
-        first_name = self.full_name.split()[0].upper()[:10]
-        year = datetime.now().year
+        # Persist the generated code even on partial saves
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'bill_identifier'}
         
-        # Generate 3-digit random suffix
+        # Rely on the unique index instead of a pre-check query; retry on a clash
+        for attempt in range(self.BILL_IDENTIFIER_ATTEMPTS):
+            self.bill_identifier = self._generate_bill_identifier(check_unique=False)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                clash = PatientProfile.objects.filter(
+                    bill_identifier=self.bill_identifier
+                ).exclude(pk=self.pk).exists()
+                if not clash or attempt == self.BILL_IDENTIFIER_ATTEMPTS - 1:
+                    raise
+    
+    @staticmethod
+    def _bill_identifier_candidate(full_name, year):
+        """Random code like JIMMY-2024-001 (first name uppercased, max 10 chars, 3-digit suffix)"""
+        first_name = full_name.split()[0].upper()[:10]
+        suffix = ''.join(secrets.choice(string.digits) for _ in range(3))
+        return f"{first_name}-{year}-{suffix}"
+    
+    def _generate_bill_identifier(self, check_unique=True):
+        """Generate unique bill identifier like: JIMMY-2024-001"""
+        year = date.today().year
         while True:
-            suffix = ''.join(random.choices(string.digits, k=3))
-            code = f"{first_name}-{year}-{suffix}"
+            code = self._bill_identifier_candidate(self.full_name, year)
             
-            # Check uniqueness
-            if not PatientProfile.objects.filter(bill_identifier=code).exists():
+            # Check uniqueness (save() skips this and lets the unique index decide)
+            if not check_unique or not PatientProfile.objects.filter(bill_identifier=code).exists():
                 return code
     
-    @property
+    @classmethod
+    def generate_bill_identifiers(cls, names, year=None):
+        """
+        Generate one unique bill identifier per full name, for bulk creates/updates.
+        Each round checks every pending candidate with a single query; only clashes are retried.
+        """
+        year = year or date.today().year
+        codes = [None] * len(names)
+        pending = list(range(len(names)))
+        chosen = set()
+        while pending:
+            candidates = {}
+            for index in pending:
+                code = cls._bill_identifier_candidate(names[index], year)
+                while code in chosen or code in candidates:
+                    code = cls._bill_identifier_candidate(names[index], year)
+                candidates[code] = index
+            taken = set(
+                cls.objects.filter(bill_identifier__in=candidates).values_list('bill_identifier', flat=True)
+            )
+            pending = []
+            for code, index in candidates.items():
+                if code in taken:
+                    pending.append(index)
+                else:
+                    codes[index] = code
+                    chosen.add(code)
+        return codes
+    
+    # Per-instance caches derived from donations/breakdowns, dropped by refresh_from_db()
+    FUNDING_CACHE_ATTRS = ('funding_received_actual', '_funding_figures', 'cost_breakdown_total')
+    
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        for attr in self.FUNDING_CACHE_ATTRS:
+            self.__dict__.pop(attr, None)
+    
+    @cached_property
     def age(self):
-        """Calculate age from user's date of birth"""
-        if self.user.date_of_birth:
+        """Calculate age from user's date of birth (load lists with .with_age_data() to avoid a query per row)"""
+        date_of_birth = self.user.date_of_birth
+        if date_of_birth:
             today = date.today()
-            return today.year - self.user.date_of_birth.year - (
-                (today.month, today.day) < (self.user.date_of_birth.month, self.user.date_of_birth.day)
+            return today.year - date_of_birth.year - (
+                (today.month, today.day) < (date_of_birth.month, date_of_birth.day)
             )
         return 0
     
-    @property
+    @cached_property
     def funding_received_actual(self):
-        """Always computed from COMPLETED donations only — never stale."""
-        from django.db.models import Sum
-        from decimal import Decimal
+        """
+        Sum of COMPLETED donations, queried once and then cached on this instance.
+        Donations completed after the first read are not reflected: call refresh_from_db()
+        (which drops the funding caches) before re-checking on a long-lived instance.
+        """
         total = self.donations.filter(status='COMPLETED').aggregate(
             total=Sum('patient_amount')
         )['total']
         return total or Decimal('0.00')
-
-    @property
-    def funding_percentage(self):
+    
+    @cached_property
+    def _funding_figures(self):
+        """Every funding figure and display string, computed together from one read of the totals"""
         received = self.funding_received_actual
-        if self.funding_required > 0:
-            percentage = round((received / self.funding_required) * 100, 2)
+        required = self.funding_required
+        raw_remaining = required - received
+        
+        if required > 0:
+            percentage_raw = round((received / required) * 100, 2)
             # Cap at 100% for display purposes (can be overfunded)
-            return min(percentage, 100.0)
-        # No target set but funds received → 100%
-        if received > 0:
-            return 100.0
-        return 0
+            percentage = min(percentage_raw, 100.0)
+        elif received > 0:
+            # No target set but funds received → 100%
+            percentage_raw = percentage = 100.0
+        else:
+            percentage_raw = percentage = 0
+        
+        is_overfunded = required > 0 and received > required
+        no_target = required == 0 and received > 0
+        if is_overfunded or no_target:
+            percentage_display = "Overfunded"
+        elif percentage >= 100:
+            percentage_display = "Fully Funded"
+        elif percentage < 1:
+            # Show 2 decimal places for small percentages (e.g., 0.01%)
+            percentage_display = f"{percentage:.2f}% of funding raised"
+        else:
+            # Show whole number for larger percentages (e.g., 42%)
+            percentage_display = f"{int(percentage)}% of funding raised"
+        
+        if raw_remaining < 0:
+            remaining_display = f"Overfunded by ${abs(raw_remaining):,.0f}"
+        elif raw_remaining == 0:
+            remaining_display = "Fully Funded"
+        else:
+            remaining_display = f"${raw_remaining:,.0f} to go"
+        
+        return {
+            'received': received,
+            'required': required,
+            'raw_remaining': raw_remaining,
+            # Never negative — overfunded means 0 remaining
+            'remaining': max(raw_remaining, 0),
+            'percentage': percentage,
+            'percentage_raw': percentage_raw,
+            'percentage_display': percentage_display,
+            'raised_display': f"${received:,.0f} raised",
+            'remaining_display': remaining_display,
+            'is_fully_funded': received >= required or no_target,
+            'is_overfunded': is_overfunded,
+        }
+    
+    @property
+    def funding_percentage(self):
+        return self._funding_figures['percentage']
     
     @property
     def funding_percentage_raw(self):
         """Raw percentage without cap (can exceed 100% for overfunded patients)"""
-        received = self.funding_received_actual
-        if self.funding_required > 0:
-            return round((received / self.funding_required) * 100, 2)
-        if received > 0:
-            return 100.0
-        return 0
+        return self._funding_figures['percentage_raw']
     
     @property
     def funding_remaining(self):
-        remaining = self.funding_required - self.funding_received_actual
-        # Never return negative — overfunded means 0 remaining
-        return max(remaining, 0)
+        return self._funding_figures['remaining']
     
     @property
     def funding_percentage_display(self):
         """Display funding percentage with appropriate precision"""
-        received = self.funding_received_actual
-        percentage = self.funding_percentage
-        is_overfunded = self.funding_required > 0 and received > self.funding_required
-        no_target = self.funding_required == 0 and received > 0
-        if is_overfunded or no_target:
-            return "Overfunded"
-        elif percentage >= 100:
-            return "Fully Funded"
-        elif percentage < 1:
-            # Show 2 decimal places for small percentages (e.g., 0.01%)
-            return f"{percentage:.2f}% of funding raised"
-        else:
-            # Show whole number for larger percentages (e.g., 42%)
-            return f"{int(percentage)}% of funding raised"
+        return self._funding_figures['percentage_display']
     
     @property
     def funding_raised_display(self):
         """Display as '$266 raised'"""
-        return f"${self.funding_received_actual:,.0f} raised"
+        return self._funding_figures['raised_display']
     
     @property
     def funding_remaining_display(self):
         """Display as '$365 to go' or 'Overfunded by $X'"""
-        raw_remaining = self.funding_required - self.funding_received_actual
-        if raw_remaining < 0:
-            return f"Overfunded by ${abs(raw_remaining):,.0f}"
-        elif raw_remaining == 0:
-            return "Fully Funded"
-        return f"${raw_remaining:,.0f} to go"
+        return self._funding_figures['remaining_display']
     
     @property
     def funding_summary(self):
         """Complete funding summary"""
-        received = self.funding_received_actual
-        is_fully_funded = received >= self.funding_required or (
-            self.funding_required == 0 and received > 0
-        )
-        is_overfunded = self.funding_required > 0 and received > self.funding_required
-        raw_remaining = self.funding_required - received
+        figures = self._funding_figures
         return {
-            'percentage': self.funding_percentage,  # Capped at 100%
-            'percentage_raw': self.funding_percentage_raw,  # Can exceed 100% if overfunded
-            'percentage_display': self.funding_percentage_display,
-            'raised': float(received),
-            'raised_display': self.funding_raised_display,
-            'remaining': float(self.funding_remaining),  # Never negative
-            'remaining_raw': float(raw_remaining),  # Can be negative if overfunded
-            'remaining_display': self.funding_remaining_display,
-            'required': float(self.funding_required),
-            'is_fully_funded': is_fully_funded,
-            'is_overfunded': is_overfunded,
-            'summary_text': f"{self.funding_raised_display}, {self.funding_remaining_display}"
+            'percentage': figures['percentage'],  # Capped at 100%
+            'percentage_raw': figures['percentage_raw'],  # Can exceed 100% if overfunded
+            'percentage_display': figures['percentage_display'],
+            'raised': float(figures['received']),
+            'raised_display': figures['raised_display'],
+            'remaining': float(figures['remaining']),  # Never negative
+            'remaining_raw': float(figures['raw_remaining']),  # Can be negative if overfunded
+            'remaining_display': figures['remaining_display'],
+            'required': float(figures['required']),
+            'is_fully_funded': figures['is_fully_funded'],
+            'is_overfunded': figures['is_overfunded'],
+            'summary_text': f"{figures['raised_display']}, {figures['remaining_display']}"
         }
     
-    @property
+    @cached_property
     def cost_breakdown_total(self):
         """Calculate total from all breakdown items"""
-        from django.db.models import Sum
+        # Prefer the with_funding_totals() annotation, then prefetched items, then one aggregate
+        if hasattr(self, 'cost_breakdown_total_db'):
+            return self.cost_breakdown_total_db or 0
+        prefetched = getattr(self, '_prefetched_objects_cache', {}).get('cost_breakdowns')
+        if prefetched is not None:
+            return sum(item.amount for item in prefetched)
         total = self.cost_breakdowns.aggregate(Sum('amount'))['amount__sum']
         return total or 0
     
@@ -318,6 +501,14 @@ class DonationAmountOption(models.Model):
         verbose_name = 'Donation Amount Option'
         verbose_name_plural = 'Donation Amount Options'
         unique_together = ['patient_profile', 'amount', 'currency']
+        indexes = [
+            # Public donation page: active options for a patient in display order
+            models.Index(fields=['patient_profile', 'is_active', 'display_order', 'amount'], name='don_opt_lookup_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(amount__gt=0), name='don_opt_amount_positive'),
+            models.CheckConstraint(condition=models.Q(display_order__gte=0), name='don_opt_display_order_gte_0'),
+        ]
     
     def __str__(self):
         recommended = " (Recommended)" if self.is_recommended else ""
@@ -326,12 +517,7 @@ class DonationAmountOption(models.Model):
     
     def get_currency_symbol(self):
         """Return the currency symbol"""
-        currency_symbols = {
-            'USD': '$', 'EUR': '€', 'GBP': '£', 'TZS': 'TSh',
-            'KES': 'KSh', 'UGX': 'USh', 'ZAR': 'R', 'NGN': '₦',
-            'GHS': 'GH₵', 'CAD': 'C$', 'AUD': 'A$',
-        }
-        return currency_symbols.get(self.currency, self.currency)
+        return CURRENCY_SYMBOLS.get(self.currency, self.currency)
 
 
 class PatientTimeline(models.Model):
@@ -395,6 +581,8 @@ class PatientTimeline(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = PatientTimelineQuerySet.as_manager()
+    
     class Meta:
         db_table = 'auth_app_patienttimeline'  # Keep existing table name
         ordering = ['created_at']  # Chronological order (oldest first)
@@ -403,6 +591,12 @@ class PatientTimeline(models.Model):
         indexes = [
             models.Index(fields=['patient_profile', 'created_at']),
             models.Index(fields=['event_type']),
+            # Current-state lookups touch one row per patient; keep the index to just those rows
+            models.Index(
+                fields=['patient_profile'],
+                condition=models.Q(is_current_state=True),
+                name='timeline_current_state_idx',
+            ),
         ]
     
     def __str__(self):
@@ -475,6 +669,8 @@ class PatientVideo(models.Model):
         blank=True,
         help_text="Optional title for the video"
     )
+    # Parsed from youtube_url on save so rendering the embed URL needs no regex work
+    video_id = models.CharField(max_length=64, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -486,23 +682,140 @@ class PatientVideo(models.Model):
     def __str__(self):
         return f"{self.patient_profile.full_name} - Video"
     
+    def save(self, *args, **kwargs):
+        self.video_id = self.extract_video_id(self.youtube_url)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'youtube_url' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'video_id'}
+        super().save(*args, **kwargs)
+    
+    @staticmethod
+    def extract_video_id(youtube_url):
+        """Extract the video ID from the various YouTube URL formats ('' if none matches)"""
+        for pattern in YOUTUBE_ID_PATTERNS:
+            match = pattern.search(youtube_url or '')
+            if match:
+                return match.group(1)
+        return ''
+    
     @property
     def youtube_embed_url(self):
         """Convert YouTube URL to embed URL"""
-        import re
-        # Extract video ID from various YouTube URL formats
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)',
-            r'youtube\.com\/embed\/([^&\n?#]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self.youtube_url)
-            if match:
-                video_id = match.group(1)
-                return f"https://www.youtube.com/embed/{video_id}"
+        if self.video_id:
+            return f"https://www.youtube.com/embed/{self.video_id}"
         return self.youtube_url
 
 
+class DailyStats(models.Model):
+    """
+    Per-day roll-up of donation and registration activity for the admin dashboard trends.
+    Rebuilt by the `recompute_daily_stats` management command (run nightly via cron).
+    """
+    date = models.DateField(primary_key=True)
+    donations_count = models.PositiveIntegerField(default=0)
+    donations_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    new_patients = models.PositiveIntegerField(default=0)
+    new_donors = models.PositiveIntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'patient_dailystats'
+        ordering = ['date']
+        verbose_name = 'Daily Stats'
+        verbose_name_plural = 'Daily Stats'
+    
+    def __str__(self):
+        return f"{self.date}: {self.donations_count} donations, {self.new_patients} patients, {self.new_donors} donors"
+    
+    @classmethod
+    def recompute(cls, start_date, end_date):
+        """Rebuild roll-up rows for every day in [start_date, end_date] that had activity"""
+        rows = cls.compute_rows(start_date, end_date)
+        with transaction.atomic():
+            cls.objects.filter(date__gte=start_date, date__lte=end_date).delete()
+            cls.objects.bulk_create([cls(date=day, **values) for day, values in rows.items()])
+        return len(rows)
+    
+    @staticmethod
+    def compute_rows(start_date, end_date):
+        """Live per-day figures ({date: values}) for the days in [start_date, end_date] that had activity"""
+        from donor.models import Donation, DonorProfile
+        
+        date_range = {'created_at__date__gte': start_date, 'created_at__date__lte': end_date}
+        rows = {}
+        
+        def bucket(day):
+            return rows.setdefault(day, {
+                'donations_count': 0,
+                'donations_amount': Decimal('0.00'),
+                'new_patients': 0,
+                'new_donors': 0,
+            })
+        
+        daily_donations = Donation.objects.filter(status='COMPLETED', **date_range).annotate(
+            day=TruncDate('created_at')
+        ).values('day').annotate(count=Count('id'), amount=Sum('amount'))
+        for item in daily_donations:
+            row = bucket(item['day'])
+            row['donations_count'] = item['count']
+            row['donations_amount'] = item['amount'] or Decimal('0.00')
+        
+        # Patient and donor registrations per day in a single UNION ALL query
+        daily_patients = PatientProfile.objects.filter(**date_range).annotate(
+            day=TruncDate('created_at'), field=Value('new_patients')
+        ).values('day', 'field').annotate(count=Count('id'))
+        daily_donors = DonorProfile.objects.filter(**date_range).annotate(
+            day=TruncDate('created_at'), field=Value('new_donors')
+        ).values('day', 'field').annotate(count=Count('id'))
+        for item in daily_patients.union(daily_donors, all=True):
+            bucket(item['day'])[item['field']] = item['count']
+        return rows
+
+
+class CountryStats(models.Model):
+    """
+    Per-country patient and donor counts for the admin dashboard breakdowns.
+    Rebuilt by the `recompute_country_stats` management command (run nightly via cron).
+    """
+    country = models.OneToOneField(
+        CountryLookup,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    patient_count = models.PositiveIntegerField(default=0)
+    donor_count = models.PositiveIntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'patient_countrystats'
+        verbose_name = 'Country Stats'
+        verbose_name_plural = 'Country Stats'
+    
+    def __str__(self):
+        return f"{self.country.name}: {self.patient_count} patients, {self.donor_count} donors"
+    
+    @classmethod
+    def recompute(cls):
+        """Rebuild the per-country counts from PatientProfile and DonorProfile"""
+        from donor.models import DonorProfile
+        
+        rows = {}
+        for model, field in ((PatientProfile, 'patient_count'), (DonorProfile, 'donor_count')):
+            counts = model.objects.filter(country_fk__isnull=False).values('country_fk').annotate(
+                count=Count('id')
+            ).values_list('country_fk', 'count')
+            for country_id, count in counts:
+                rows.setdefault(country_id, {'patient_count': 0, 'donor_count': 0})[field] = count
+        
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create([cls(country_id=country_id, **values) for country_id, values in rows.items()])
+        return len(rows)
+
+
 # Import donation models
 # Donation models are now in the donor app
 # from donor.models import Donation, DonationReceipt, DonationComment
@@ -1,9 +1,14 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate, get_user_model
+from django.db import transaction, IntegrityError
+from django.db.models import F, Q, Sum
 from datetime import date
+from django.utils.functional import cached_property
 from decimal import Decimal
 from utils.base_64_serializer_field import Base64AnyFileField
 
+from auth_app.lookups import CountryLookup
+from auth_app.serializers import CountryLookupSerializer
 from auth_app.exceptions import (
     EmailAlreadyExistsException, PasswordTooShortException,
     InvalidDateException, InvalidCredentialsException,
@@ -18,6 +23,18 @@ from donor.models import Donation, DonationReceipt, DonationComment
 User = get_user_model()
 
 
+def _build_media_url(request, file_field):
+    """Absolute URL for a stored file; the scheme and host are worked out once per request"""
+    url = file_field.url
+    if not url.startswith('/') or url.startswith('//'):
+        # Already absolute (e.g. remote storage) or protocol-relative
+        return request.build_absolute_uri(url)
+    prefix = getattr(request, '_media_url_prefix', None)
+    if prefix is None:
+        prefix = request._media_url_prefix = f"{request.scheme}://{request.get_host()}"
+    return prefix + url
+
+
 class PatientImageSerializer(serializers.ModelSerializer):
     """Serializer for patient images"""
     image = Base64AnyFileField(
@@ -36,7 +53,7 @@ class PatientImageSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if obj.image:
             if request:
-                return request.build_absolute_uri(obj.image.url)
+                return _build_media_url(request, obj.image)
             return obj.image.url
         return None
 
@@ -83,30 +100,31 @@ class DonationAmountOptionSerializer(serializers.ModelSerializer):
         return obj.get_currency_symbol()
 
 
-class DonationAmountOptionCreateSerializer(serializers.ModelSerializer):
-    """Serializer for creating/updating donation amount options (admin only)"""
-    
-    class Meta:
-        model = DonationAmountOption
-        fields = ['amount', 'currency', 'display_order', 'is_active', 'is_recommended']
-    
-    def validate_amount(self, value):
-        """Ensure amount is positive"""
-        if value <= 0:
-            raise serializers.ValidationError("Amount must be greater than 0")
-        return value
+class DonationAmountOptionCreateSerializer(DonationAmountOptionSerializer):
+    """
+    Serializer for creating/updating donation amount options (admin only).
+    Writable fields are amount, currency, display_order, is_active and is_recommended;
+    the response uses the same representation as DonationAmountOptionSerializer.
+    """
     
-    def validate_display_order(self, value):
-        """Ensure display order is non-negative"""
-        if value < 0:
-            raise serializers.ValidationError("Display order cannot be negative")
-        return value
+    class Meta(DonationAmountOptionSerializer.Meta):
+        # Bounds mirror the model's check constraints
+        extra_kwargs = {
+            'amount': {
+                'min_value': Decimal('0.01'),
+                'error_messages': {'min_value': 'Amount must be greater than 0'},
+            },
+            'display_order': {
+                'min_value': 0,
+                'error_messages': {'min_value': 'Display order cannot be negative'},
+            },
+        }
 
 
 class PatientTimelineSerializer(serializers.ModelSerializer):
     formatted_date = serializers.ReadOnlyField()
     event_type_display = serializers.CharField(source='get_event_type_display', read_only=True)
-    is_future = serializers.ReadOnlyField()
+    is_future = serializers.SerializerMethodField()
     created_by_name = serializers.SerializerMethodField()
     
     class Meta:
@@ -118,74 +136,104 @@ class PatientTimelineSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'formatted_date', 'is_future']
     
+    @cached_property
+    def _today(self):
+        # Read the clock once per serializer; a many=True child is shared by every event
+        return date.today()
+    
+    def get_is_future(self, obj):
+        return bool(obj.event_date) and obj.event_date > self._today
+    
     def get_created_by_name(self, obj):
+        if hasattr(obj, 'created_by_name'):  # PatientTimeline.objects.with_created_by_name()
+            return obj.created_by_name
         if obj.created_by:
             return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.email
         return None
 
 
-class PatientProfileSerializer(serializers.ModelSerializer):
-    from auth_app.serializers import CountryLookupSerializer
-    
+# Field groups shared by the patient-facing and admin review profile serializers
+PATIENT_STORY_FIELDS = (
+    'photo', 'photo_url', 'full_name', 'age', 'gender', 'country',
+    'short_description', 'long_story', 'medical_partner',
+    'diagnosis', 'treatment_needed', 'treatment_date',
+)
+PATIENT_FUNDING_FIELDS = (
+    'funding_required', 'funding_received', 'funding_currency', 'total_treatment_cost',
+    'funding_percentage', 'funding_remaining',
+)
+PATIENT_STATUS_FIELDS = ('status', 'created_at', 'updated_at')
+
+
+class BasePatientProfileSerializer(serializers.ModelSerializer):
+    """Read-only fields, photo URL and eager loading common to the patient profile serializers"""
     age = serializers.ReadOnlyField()
     funding_received = serializers.ReadOnlyField(source='funding_received_actual')
     funding_percentage = serializers.ReadOnlyField()
     funding_remaining = serializers.ReadOnlyField()
-    funding_percentage_display = serializers.ReadOnlyField()
-    funding_raised_display = serializers.ReadOnlyField()
-    funding_remaining_display = serializers.ReadOnlyField()
-    funding_summary = serializers.ReadOnlyField()
-    cost_breakdown_total = serializers.ReadOnlyField()
-    other_contributions = serializers.ReadOnlyField()
     cost_breakdowns = TreatmentCostBreakdownSerializer(many=True, read_only=True)
     timeline_events = PatientTimelineSerializer(many=True, read_only=True)
     country = CountryLookupSerializer(source='country_fk', read_only=True)
     photo_url = serializers.SerializerMethodField()
-    images = PatientImageSerializer(many=True, read_only=True)
-    video = PatientVideoSerializer(read_only=True)
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load every relation rendered by this serializer in a constant number of queries"""
+        return queryset.with_age_data().with_funding_received().with_cost_breakdowns().with_timeline()
     
     def get_photo_url(self, obj):
         """Return full URL for patient photo"""
         if obj.photo:
             request = self.context.get('request')
             if request:
-                return request.build_absolute_uri(obj.photo.url)
+                return _build_media_url(request, obj.photo)
             return obj.photo.url
         return None
+
+
+class PatientProfileSerializer(BasePatientProfileSerializer):
+    funding_percentage_display = serializers.ReadOnlyField()
+    funding_raised_display = serializers.ReadOnlyField()
+    funding_remaining_display = serializers.ReadOnlyField()
+    funding_summary = serializers.ReadOnlyField()
+    cost_breakdown_total = serializers.ReadOnlyField()
+    other_contributions = serializers.ReadOnlyField()
+    images = PatientImageSerializer(many=True, read_only=True)
+    video = PatientVideoSerializer(read_only=True)
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return super().setup_eager_loading(queryset).select_related('video').prefetch_related('images')
     
     def to_representation(self, instance):
         """Override to ensure photo field also uses absolute URL"""
         representation = super().to_representation(instance)
         
-        # Convert photo field to absolute URL if it exists
+        # Convert photo field to absolute URL if it exists (photo_url already holds it)
         if representation.get('photo'):
             request = self.context.get('request')
             if request:
-                representation['photo'] = request.build_absolute_uri(instance.photo.url)
+                representation['photo'] = representation['photo_url']
         
         return representation
     
     class Meta:
         model = PatientProfile
-        fields = [
-            'id', 'user', 'bill_identifier', 'photo', 'photo_url', 'full_name', 'age', 'gender', 'country',
-            'short_description', 'long_story', 'medical_partner',
-            'diagnosis', 'treatment_needed', 'treatment_date',
+        fields = (
+            ('id', 'user', 'bill_identifier')
+            + PATIENT_STORY_FIELDS
             # Media
-            'images', 'video',
+            + ('images', 'video')
             # Funding summary
-            'funding_required', 'funding_received', 'funding_currency', 'total_treatment_cost',
-            'funding_percentage', 'funding_remaining', 'other_contributions',
+            + PATIENT_FUNDING_FIELDS + ('other_contributions',)
             # Funding display fields
-            'funding_percentage_display', 'funding_raised_display', 
-            'funding_remaining_display', 'funding_summary',
-            # Cost breakdown (dynamic items)
-            'cost_breakdowns', 'cost_breakdown_notes', 'cost_breakdown_total',
-            # Timeline
-            'timeline_events',
+            + ('funding_percentage_display', 'funding_raised_display',
+               'funding_remaining_display', 'funding_summary')
+            # Cost breakdown (dynamic items) and timeline
+            + ('cost_breakdowns', 'cost_breakdown_notes', 'cost_breakdown_total', 'timeline_events')
             # Status & timestamps
-            'status', 'created_at', 'updated_at'
-        ]
+            + PATIENT_STATUS_FIELDS
+        )
         # Patients can update basic info and story, admin updates medical/funding via Django admin
         read_only_fields = [
             'user', 'bill_identifier', 'age', 'medical_partner',
@@ -230,11 +278,6 @@ class PatientRegisterSerializer(serializers.ModelSerializer):
                   'gender', 'country_id', 'country', 'photo', 'images', 'youtube_url', 'video_title',
                   'short_description', 'long_story']
     
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise EmailAlreadyExistsException()
-        return value
-    
     def validate_phone_number(self, value):
         if not value or len(value) < 10:
             raise serializers.ValidationError("Phone number must be at least 10 digits")
@@ -254,26 +297,34 @@ class PatientRegisterSerializer(serializers.ModelSerializer):
         return value
     
     def validate_country_id(self, value):
-        from auth_app.lookups import CountryLookup
-        if not CountryLookup.objects.filter(id=value, is_active=True).exists():
+        try:
+            # Kept for create(), which would otherwise fetch the same row again
+            self._country_lookup = CountryLookup.objects.get(id=value, is_active=True)
+        except CountryLookup.DoesNotExist:
             raise serializers.ValidationError("Invalid country ID or country is not active.")
         return value
     
+    @transaction.atomic
     def create(self, validated_data):
-        from auth_app.lookups import CountryLookup
+        # One transaction for the user, profile and media rows: a failure part-way
+        # no longer leaves an orphaned patient user behind
         
-        # Extract patient profile fields
-        gender = validated_data.pop('gender')
-        country_id = validated_data.pop('country_id', None)
-        country_name = validated_data.pop('country', None)
-        photo = validated_data.pop('photo', None)
-        short_description = validated_data.pop('short_description')
-        long_story = validated_data.pop('long_story')
-        date_of_birth = validated_data.pop('date_of_birth')
+        # Read the profile and media fields in one place; validated_data is never
+        # spread into a create() call, so nothing needs popping out of it
+        gender = validated_data['gender']
+        country_id = validated_data.get('country_id')
+        country_name = validated_data.get('country')
+        photo = validated_data.get('photo')
+        short_description = validated_data['short_description']
+        long_story = validated_data['long_story']
+        date_of_birth = validated_data['date_of_birth']
+        images = validated_data.get('images', [])
+        youtube_url = validated_data.get('youtube_url')
+        video_title = validated_data.get('video_title', '')
         
         # Get or create country lookup object
         if country_id:
-            country_lookup = CountryLookup.objects.get(id=country_id)
+            country_lookup = self._country_lookup
         elif country_name:
             country_lookup, _ = CountryLookup.objects.get_or_create(
                 name=country_name,
@@ -282,25 +333,25 @@ class PatientRegisterSerializer(serializers.ModelSerializer):
         else:
             country_lookup = None
         
-        # Create user without password (patients register without login initially)
-        user = User.objects.create(
-            email=validated_data['email'],
-            phone_number=validated_data['phone_number'],
-            first_name=validated_data['first_name'],
-            last_name=validated_data['last_name'],
-            date_of_birth=date_of_birth,
-            user_type='PATIENT',
-            is_active=True  # Active by default, but not verified
-        )
+        # Create user without password (patients register without login initially).
+        # The email field's UniqueValidator is only the fast path; the unique index settles
+        # concurrent signups.
+        try:
+            user = User.objects.create(
+                email=validated_data['email'],
+                phone_number=validated_data['phone_number'],
+                first_name=validated_data['first_name'],
+                last_name=validated_data['last_name'],
+                date_of_birth=date_of_birth,
+                user_type='PATIENT',
+                is_active=True  # Active by default, but not verified
+            )
+        except IntegrityError:
+            raise EmailAlreadyExistsException()
         
         # Build full name from first and last name
         full_name = f"{user.first_name} {user.last_name}".strip()
         
-        # Extract images and video data
-        images = validated_data.pop('images', [])
-        youtube_url = validated_data.pop('youtube_url', None)
-        video_title = validated_data.pop('video_title', '')
-        
         # Create patient profile
         profile = PatientProfile.objects.create(
             user=user,
@@ -312,15 +363,17 @@ class PatientRegisterSerializer(serializers.ModelSerializer):
             long_story=long_story
         )
         
-        # Create patient images if provided
+        # Create patient images if provided, in one INSERT (files are stored by the field's pre_save)
         if images:
-            for index, image in enumerate(images):
-                PatientImage.objects.create(
+            PatientImage.objects.bulk_create([
+                PatientImage(
                     patient_profile=profile,
                     image=image,
                     display_order=index,
                     is_primary=(index == 0 and not photo)  # First image is primary if no profile photo
                 )
+                for index, image in enumerate(images)
+            ])
         
         # Create patient video if YouTube URL provided
         if youtube_url:
@@ -336,46 +389,24 @@ class PatientRegisterSerializer(serializers.ModelSerializer):
 
 # ============ ADMIN SERIALIZERS ============
 
-class AdminPatientReviewSerializer(serializers.ModelSerializer):
+class AdminPatientReviewSerializer(BasePatientProfileSerializer):
     """
     Admin-only serializer for reviewing and editing patient profiles.
     Allows admin to edit medical details, funding, and story.
     """
-    from auth_app.serializers import CountryLookupSerializer
-    
     user_email = serializers.EmailField(source='user.email', read_only=True)
     user_verified = serializers.BooleanField(source='user.is_verified', read_only=True)
     patient_verified = serializers.BooleanField(source='user.is_patient_verified', read_only=True)
-    age = serializers.ReadOnlyField()
-    funding_received = serializers.ReadOnlyField(source='funding_received_actual')
-    funding_percentage = serializers.ReadOnlyField()
-    funding_remaining = serializers.ReadOnlyField()
-    cost_breakdowns = TreatmentCostBreakdownSerializer(many=True, read_only=True)
-    timeline_events = PatientTimelineSerializer(many=True, read_only=True)
-    country = CountryLookupSerializer(source='country_fk', read_only=True)
-    photo_url = serializers.SerializerMethodField()
-    
-    def get_photo_url(self, obj):
-        """Return full URL for patient photo"""
-        if obj.photo:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.photo.url)
-            return obj.photo.url
-        return None
     
     class Meta:
         model = PatientProfile
-        fields = [
-            'id', 'user', 'user_email', 'user_verified', 'patient_verified',
-            'photo', 'photo_url', 'full_name', 'age', 'gender', 'country',
-            'short_description', 'long_story', 'medical_partner',
-            'diagnosis', 'treatment_needed', 'treatment_date',
-            'funding_required', 'funding_received', 'funding_currency', 'total_treatment_cost',
-            'funding_percentage', 'funding_remaining',
-            'cost_breakdowns', 'cost_breakdown_notes',
-            'timeline_events', 'status', 'created_at', 'updated_at'
-        ]
+        fields = (
+            ('id', 'user', 'user_email', 'user_verified', 'patient_verified')
+            + PATIENT_STORY_FIELDS
+            + PATIENT_FUNDING_FIELDS
+            + ('cost_breakdowns', 'cost_breakdown_notes', 'timeline_events')
+            + PATIENT_STATUS_FIELDS
+        )
         read_only_fields = ['id', 'user', 'age', 'funding_percentage', 'funding_remaining', 
                            'cost_breakdowns', 'timeline_events', 'created_at', 'updated_at', 'country']
 
@@ -438,6 +469,11 @@ class AdminPatientManagementSerializer(serializers.ModelSerializer):
     created_by_admin = serializers.SerializerMethodField()
     last_updated_by = serializers.SerializerMethodField()
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the user and country rows and annotate the funding total; no nested lists are rendered"""
+        return queryset.with_age_data().with_funding_received()
+    
     class Meta:
         model = PatientProfile
         fields = [
@@ -457,7 +493,7 @@ class AdminPatientManagementSerializer(serializers.ModelSerializer):
         if obj.photo:
             request = self.context.get('request')
             if request:
-                return request.build_absolute_uri(obj.photo.url)
+                return _build_media_url(request, obj.photo)
         return None
     
     def get_created_by_admin(self, obj):
@@ -474,8 +510,6 @@ class AdminPatientCreateSerializer(serializers.ModelSerializer):
     Serializer for admin to create new patient profiles.
     Supports base64 photo upload.
     """
-    from utils.base_64_serializer_field import Base64AnyFileField
-    
     photo = Base64AnyFileField(
         allowed_types=['jpeg', 'jpg', 'png'],
         max_file_size=5 * 1024 * 1024,  # 5MB
@@ -514,8 +548,7 @@ class AdminPatientCreateSerializer(serializers.ModelSerializer):
             user_data['date_of_birth'] = validated_data.pop('user_date_of_birth')
         
         # Create user
-        from auth_app.models import CustomUser
-        user = CustomUser.objects.create_user(**user_data)
+        user = User.objects.create_user(**user_data)
         
         # Create patient profile
         validated_data['user'] = user
@@ -589,6 +622,8 @@ class AdminTimelineEventSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'formatted_date', 'created_at', 'updated_at']
     
     def get_created_by_name(self, obj):
+        if hasattr(obj, 'created_by_name'):  # PatientTimeline.objects.with_created_by_name()
+            return obj.created_by_name
         if obj.created_by:
             return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.email
         return None
@@ -604,6 +639,31 @@ class AdminBulkTimelineCreateSerializer(serializers.Serializer):
     """
     patient_profile_id = serializers.IntegerField()
     events = AdminTimelineEventSerializer(many=True)
+    
+    @transaction.atomic
+    def create(self, validated_data):
+        """Insert every event with one bulk INSERT instead of a save() per event"""
+        patient_profile_id = validated_data['patient_profile_id']
+        # The author passed as save(created_by=request.user) applies to every event
+        created_by = validated_data.get('created_by')
+        events = []
+        for event_data in validated_data['events']:
+            event_data.pop('patient_profile', None)
+            if created_by is not None:
+                event_data['created_by'] = created_by
+            events.append(PatientTimeline(patient_profile_id=patient_profile_id, **event_data))
+        
+        # Same rule as the single-event endpoints: one current state per patient,
+        # here the last event in the batch that asks for it
+        current = [event for event in events if event.is_current_state]
+        if current:
+            PatientTimeline.objects.filter(
+                patient_profile_id=patient_profile_id, is_current_state=True
+            ).update(is_current_state=False)
+            for event in current[:-1]:
+                event.is_current_state = False
+        
+        return PatientTimeline.objects.bulk_create(events, batch_size=500)
 
 
 class AdminPatientFeaturedSerializer(serializers.Serializer):
@@ -621,7 +681,6 @@ class AdminPatientFeaturedSerializer(serializers.Serializer):
         """
         if value:
             # Check current featured count
-            from .models import PatientProfile
             current_featured = PatientProfile.objects.filter(is_featured=True).count()
             
             # Get the patient we're updating (if it's not already featured)
@@ -656,13 +715,13 @@ class DonationCreateSerializer(serializers.Serializer):
     patient_amount = serializers.DecimalField(
         max_digits=10, 
         decimal_places=2, 
-        min_value=0.00,
+        min_value=Decimal('0.00'),
         help_text="Amount allocated to patient (required if patient selected)"
     )
     rhci_support_amount = serializers.DecimalField(
         max_digits=10, 
         decimal_places=2, 
-        min_value=0.00,
+        min_value=Decimal('0.00'),
         required=False,
         allow_null=True,
         default=Decimal('0.00'),
@@ -691,23 +750,11 @@ class DonationCreateSerializer(serializers.Serializer):
     
     def validate(self, data):
         """Validate donation data and calculate total"""
-        from decimal import Decimal
-        
         # Get amounts
         patient_amount = data.get('patient_amount', Decimal('0.00'))
         rhci_support_amount = data.get('rhci_support_amount') or Decimal('0.00')
         
-        # Validate patient_amount
-        if patient_amount < 0:
-            raise serializers.ValidationError({
-                'patient_amount': 'Patient amount cannot be negative'
-            })
-        
-        # Validate rhci_support_amount
-        if rhci_support_amount < 0:
-            raise serializers.ValidationError({
-                'rhci_support_amount': 'RHCI support amount cannot be negative'
-            })
+        # Negative amounts are rejected by the fields' min_value
         
         # Validate total is greater than 0
         total_amount = patient_amount + rhci_support_amount
@@ -732,11 +779,12 @@ class DonationCreateSerializer(serializers.Serializer):
                     "Anonymous donations require either a name or email address"
                 )
         
-        # If patient_id provided, verify patient exists
+        # If patient_id provided, resolve the patient once; the view reuses it
         if data.get('patient_id'):
-            from .models import PatientProfile
-            if not PatientProfile.objects.filter(id=data['patient_id']).exists():
+            patient = PatientProfile.objects.filter(id=data.pop('patient_id')).first()
+            if patient is None:
                 raise serializers.ValidationError({"patient_id": "Patient not found"})
+            data['patient'] = patient
         
         return data
 
@@ -767,10 +815,23 @@ class DonationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'completed_at']
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the donor row read by donor_name, and fetch the patient's name and the sum of
+        completed recurring payments (total_recurring_amount) in the same query"""
+        return queryset.select_related('donor').annotate(
+            patient_full_name=F('patient__full_name'),
+            recurring_completed_total=Sum(
+                'recurring_payments__amount', filter=Q(recurring_payments__status='COMPLETED')
+            )
+        )
+    
     def get_donor_name(self, obj):
         return obj.get_donor_display_name()
     
     def get_patient_name(self, obj):
+        if hasattr(obj, 'patient_full_name'):  # setup_eager_loading()
+            return obj.patient_full_name or "General Fund"
         return obj.patient.full_name if obj.patient else "General Fund"
 
 
@@ -788,9 +849,26 @@ class DonationDetailSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Donation
-        fields = '__all__'
+        fields = [
+            'id', 'donor', 'donor_name', 'donor_email', 'is_anonymous',
+            'anonymous_name', 'anonymous_email',
+            'patient', 'patient_name',
+            'amount', 'patient_amount', 'rhci_support_amount',
+            'currency', 'amount_usd', 'exchange_rate', 'rate_locked_at',
+            'donation_type', 'donation_type_display', 'status', 'status_display',
+            'payment_method', 'transaction_id', 'payment_gateway', 'gateway_reference',
+            'failure_reason', 'message', 'dedication',
+            'is_recurring', 'recurring_frequency', 'next_charge_date',
+            'is_recurring_active', 'parent_donation', 'total_recurring_amount',
+            'created_at', 'updated_at', 'completed_at'
+        ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'completed_at']
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Same relations and annotation as DonationSerializer"""
+        return DonationSerializer.setup_eager_loading(queryset)
+    
     def get_donor_name(self, obj):
         return obj.get_donor_display_name()
     
@@ -800,14 +878,25 @@ class DonationDetailSerializer(serializers.ModelSerializer):
         return obj.anonymous_email
     
     def get_patient_name(self, obj):
+        if hasattr(obj, 'patient_full_name'):  # setup_eager_loading()
+            return obj.patient_full_name or "General Fund"
         return obj.patient.full_name if obj.patient else "General Fund"
 
 
 class DonationReceiptSerializer(serializers.ModelSerializer):
-    """Serializer for donation receipts"""
+    """
+    Serializer for donation receipts.
+    The nested donation is only rendered when the context sets expand_donation
+    (e.g. from ?expand=donation); receipt lists skip that sub-serializer per row.
+    """
     donation_details = DonationSerializer(source='donation', read_only=True)
     
     class Meta:
         model = DonationReceipt
         fields = ['id', 'receipt_number', 'receipt_url', 'email_sent', 'email_sent_at', 'created_at', 'donation_details']
         read_only_fields = ['id', 'created_at']
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not self.context.get('expand_donation'):
+            self.fields.pop('donation_details')
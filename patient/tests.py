@@ -1,3 +1,229 @@
-from django.test import TestCase
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from auth_app.lookups import CountryLookup
+from auth_app.models import CustomUser
+from donor.models import Donation, DonorProfile
+from .models import PatientProfile, PatientTimeline, DailyStats, CountryStats
+from .serializers import AdminBulkTimelineCreateSerializer
+
+
+def create_patient(email='patient@example.com', status='PUBLISHED', **extra):
+    user = CustomUser.objects.create_user(
+        email=email, password='pass12345', user_type='PATIENT',
+        is_active=True, is_patient_verified=True
+    )
+    return PatientProfile.objects.create(
+        user=user,
+        full_name=extra.pop('full_name', 'Test Patient'),
+        gender='F',
+        short_description='Needs surgery',
+        long_story='Story',
+        status=status,
+        **extra
+    )
+
+
+class PatientTimelineRenderingTests(TestCase):
+    """Profile endpoints render timeline events with created_by_name annotated in SQL"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user(
+            email='admin@example.com', password='pass12345', user_type='ADMIN',
+            is_active=True, is_staff=True, first_name='Ada', last_name='Admin'
+        )
+        cls.unnamed_author = CustomUser.objects.create_user(
+            email='staff@example.com', password='pass12345', user_type='ADMIN',
+            is_active=True, is_staff=True
+        )
+        cls.patient = create_patient()
+        PatientTimeline.objects.create(
+            patient_profile=cls.patient, event_type='UPDATE_POSTED', title='Named',
+            description='By a named admin', created_by=cls.admin
+        )
+        PatientTimeline.objects.create(
+            patient_profile=cls.patient, event_type='UPDATE_POSTED', title='Unnamed',
+            description='By an admin without a name', created_by=cls.unnamed_author
+        )
+    
+    def assert_timeline_authors(self, response):
+        self.assertEqual(response.status_code, 200)
+        names = {event['title']: event['created_by_name'] for event in response.data['timeline_events']}
+        self.assertEqual(names['Named'], 'Ada Admin')
+        self.assertEqual(names['Unnamed'], 'staff@example.com')
+        # The auto-created submission event has no author
+        self.assertIsNone(names['Profile Submitted'])
+    
+    def test_public_detail_renders_timeline(self):
+        response = APIClient().get(reverse('patient:public_patient_detail', kwargs={'id': self.patient.id}))
+        self.assert_timeline_authors(response)
+    
+    def test_public_list_renders_timeline(self):
+        response = APIClient().get(reverse('patient:public_patient_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_admin_detail_renders_timeline(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        response = client.get(reverse('patient:admin_patient_detail', kwargs={'id': self.patient.id}))
+        self.assert_timeline_authors(response)
+    
+    def test_admin_timeline_list(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        response = client.get(reverse('patient:admin_timeline_list', kwargs={'patient_id': self.patient.id}))
+        self.assertEqual(response.status_code, 200)
+        names = {event['title']: event['created_by_name'] for event in response.data['results']}
+        self.assertEqual(names['Named'], 'Ada Admin')
+        self.assertEqual(names['Unnamed'], 'staff@example.com')
+
+
+class AdminBulkTimelineCreateSerializerTests(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user(
+            email='admin@example.com', password='pass12345', user_type='ADMIN',
+            is_active=True, is_staff=True
+        )
+        cls.patient = create_patient()
+    
+    def test_events_take_the_saving_author_and_a_single_current_state(self):
+        events = [
+            {
+                'patient_profile': self.patient.id, 'event_type': 'UPDATE_POSTED',
+                'title': f'Update {number}', 'description': 'Progress', 'is_current_state': True,
+            }
+            for number in range(3)
+        ]
+        serializer = AdminBulkTimelineCreateSerializer(
+            data={'patient_profile_id': self.patient.id, 'events': events}
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save(created_by=self.admin)
+        
+        updates = PatientTimeline.objects.filter(patient_profile=self.patient, event_type='UPDATE_POSTED')
+        self.assertEqual(updates.count(), 3)
+        self.assertFalse(updates.exclude(created_by=self.admin).exists())
+        current = PatientTimeline.objects.filter(patient_profile=self.patient, is_current_state=True)
+        self.assertEqual(list(current.values_list('title', flat=True)), ['Update 2'])
+
+
+def create_donation(amount, created_at, status='COMPLETED'):
+    donation = Donation.objects.create(amount=amount, patient_amount=amount, status=status)
+    Donation.objects.filter(pk=donation.pk).update(created_at=created_at)
+    return donation
+
+
+@override_settings(TIME_ZONE='Africa/Dar_es_Salaam')
+class DailyStatsTests(TestCase):
+    
+    def setUp(self):
+        cache.clear()
+        self.now = timezone.now()
+        self.today = timezone.localdate(self.now)
+        self.three_days_ago = self.now - timedelta(days=3)
+        
+        patient = create_patient()
+        PatientProfile.objects.filter(pk=patient.pk).update(created_at=self.three_days_ago)
+        donor_user = CustomUser.objects.create_user(
+            email='donor@example.com', password='pass12345', user_type='DONOR'
+        )
+        DonorProfile.objects.filter(user=donor_user).update(created_at=self.now)
+        
+        create_donation(Decimal('10.00'), self.three_days_ago)
+        create_donation(Decimal('15.50'), self.three_days_ago)
+        create_donation(Decimal('99.00'), self.three_days_ago, status='PENDING')
+        create_donation(Decimal('20.00'), self.now)
+    
+    def test_recompute_matches_live_aggregates(self):
+        start = self.today - timedelta(days=7)
+        DailyStats.recompute(start, self.today)
+        
+        completed = Donation.objects.filter(status='COMPLETED')
+        expected_days = set(completed.values_list('created_at__date', flat=True))
+        expected_days |= set(PatientProfile.objects.values_list('created_at__date', flat=True))
+        expected_days |= set(DonorProfile.objects.values_list('created_at__date', flat=True))
+        self.assertEqual(set(DailyStats.objects.values_list('date', flat=True)), expected_days)
+        
+        for row in DailyStats.objects.all():
+            donations = completed.filter(created_at__date=row.date).aggregate(
+                count=Count('id'), amount=Sum('amount')
+            )
+            self.assertEqual(row.donations_count, donations['count'])
+            self.assertEqual(row.donations_amount, donations['amount'] or Decimal('0.00'))
+            self.assertEqual(row.new_patients, PatientProfile.objects.filter(created_at__date=row.date).count())
+            self.assertEqual(row.new_donors, DonorProfile.objects.filter(created_at__date=row.date).count())
+    
+    def test_trends_fill_days_after_the_last_rollup_live(self):
+        three_days_ago = timezone.localdate(self.three_days_ago)
+        DailyStats.recompute(self.today - timedelta(days=7), three_days_ago)
+        # The last roll-up ran two days ago; everything since has not been rolled up
+        DailyStats.objects.update(updated_at=self.now - timedelta(days=2))
+        create_donation(Decimal('5.00'), self.now - timedelta(days=1))
+        
+        admin = CustomUser.objects.create_user(
+            email='admin@example.com', password='pass12345', user_type='ADMIN',
+            is_active=True, is_staff=True
+        )
+        client = APIClient()
+        client.force_authenticate(admin)
+        response = client.get(reverse('patient:admin_dashboard_stats'), {'sections': 'trends'})
+        self.assertEqual(response.status_code, 200)
+        
+        donations = {
+            str(entry['date']): (entry['count'], Decimal(entry['amount']))
+            for entry in response.data['daily_donations_trend']
+        }
+        self.assertEqual(donations, {
+            str(three_days_ago): (2, Decimal('25.50')),
+            str(self.today - timedelta(days=1)): (1, Decimal('5.00')),
+            str(self.today): (1, Decimal('20.00')),
+        })
+        registrations = {
+            str(entry['date']): (entry['patients'], entry['donors'])
+            for entry in response.data['daily_registrations_trend']
+        }
+        self.assertEqual(registrations, {
+            str(three_days_ago): (1, 0),
+            str(self.today): (0, 1),
+        })
+
+
+class CountryStatsTests(TestCase):
+    
+    def test_recompute_matches_live_counts(self):
+        tanzania = CountryLookup.objects.create(name='Tanzania', code='TZA')
+        kenya = CountryLookup.objects.create(name='Kenya', code='KEN')
+        create_patient('p1@example.com', country_fk=tanzania)
+        create_patient('p2@example.com', country_fk=tanzania)
+        create_patient('p3@example.com', country_fk=kenya)
+        create_patient('p4@example.com')
+        donor_user = CustomUser.objects.create_user(
+            email='donor@example.com', password='pass12345', user_type='DONOR'
+        )
+        DonorProfile.objects.filter(user=donor_user).update(country_fk=kenya)
+        # Stale rows are replaced, not added to
+        CountryStats.objects.create(country=tanzania, patient_count=99, donor_count=99)
+        
+        self.assertEqual(CountryStats.recompute(), 2)
+        
+        counts = {
+            stats.country_id: (stats.patient_count, stats.donor_count)
+            for stats in CountryStats.objects.all()
+        }
+        for country in (tanzania, kenya):
+            self.assertEqual(counts[country.id], (
+                PatientProfile.objects.filter(country_fk=country).count(),
+                DonorProfile.objects.filter(country_fk=country).count(),
+            ))
+        self.assertEqual(counts, {tanzania.id: (2, 0), kenya.id: (1, 1)})
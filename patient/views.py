@@ -140,7 +140,7 @@ class PatientProfileView(generics.RetrieveUpdateAPIView):
     
     def get_object(self):
         try:
-            return PatientProfile.objects.get(user=self.request.user)
+            return PatientProfileSerializer.setup_eager_loading(PatientProfile.objects.all()).get(user=self.request.user)
         except PatientProfile.DoesNotExist:
             raise PatientProfileNotFoundException()
 
@@ -242,9 +242,11 @@ class RandomizedPatientListView(APIView):
         # Get all published patients needing funding
         patients = PatientProfile.objects.filter(
             status__in=['PUBLISHED', 'AWAITING_FUNDING']
-        ).select_related('user')
+        )
         
-        total_count = patients.count()
+        # Only ids are loaded for the shuffle; the wide profile row is fetched for the chosen patient alone
+        patient_ids = list(patients.values_list('id', flat=True))
+        total_count = len(patient_ids)
         
         if total_count == 0:
             return Response({
@@ -267,12 +269,11 @@ class RandomizedPatientListView(APIView):
             page_number = total_count
         
         # Randomize the patient list (fresh random order each call!)
-        patients_list = list(patients)
-        random.shuffle(patients_list)
+        random.shuffle(patient_ids)
         
         # Get the patient for current page (1 per page)
         patient_index = page_number - 1
-        patient = patients_list[patient_index]
+        patient = PatientProfileSerializer.setup_eager_loading(patients).get(id=patient_ids[patient_index])
         
         # Serialize patient data with request context for absolute URLs
         serializer = PatientProfileSerializer(patient, context={'request': request})
@@ -1,6 +1,7 @@
 import io
 import logging
 import base64
+import binascii
 import uuid
 import time
 import mimetypes
@@ -85,17 +86,16 @@ class Base64AnyFileField(serializers.FileField):
                 # Generate random filename
                 filename = f"{uuid.uuid4()}.{ext}"
 
-                # Decode base64
-                binary_data = base64.b64decode(datastr)
-
                 # Validate file size - use document-type-specific limit if available
-                file_size = len(binary_data)
                 max_size = self.max_file_size
                 
                 # If document_type is provided, use specific limit for that document type
                 if self.document_type and self.document_type in self.DOCUMENT_SIZE_LIMITS:
                     max_size = self.DOCUMENT_SIZE_LIMITS[self.document_type]
                 
+                # Size is derived from the encoded length so oversized uploads are rejected
+                # before any bytes are decoded; exact for well-formed (padded) base64
+                file_size = (len(datastr) * 3) // 4 - datastr[-2:].count("=")
                 if file_size > max_size:
                     max_size_mb = max_size / (1024 * 1024)
                     current_size_mb = file_size / (1024 * 1024)
@@ -106,6 +106,12 @@ class Base64AnyFileField(serializers.FileField):
                         }
                     )
 
+                # Decode base64
+                try:
+                    binary_data = base64.b64decode(datastr, validate=True)
+                except binascii.Error as e:
+                    raise ValueError(f"Invalid base64: {e}") from e
+
                 # Check file type
                 detected_file_type = None
                 if HAS_MAGIC: